@@ -16,6 +16,28 @@ branch_labels = None
 depends_on = None
 
 
+def _create_index(name, table, columns, unique=False):
+    """Create an index, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY "
+            f"IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+        )
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def _drop_index(name, table):
+    """Drop an index, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("COMMIT")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    else:
+        op.drop_index(name, table_name=table)
+
+
 def upgrade() -> None:
     """Create API keys table."""
     # Create api_keys table
@@ -42,29 +64,29 @@ def upgrade() -> None:
     )
     
     # Create indexes
-    op.create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'], unique=True)
-    op.create_index('ix_api_keys_key_prefix', 'api_keys', ['key_prefix'])
-    op.create_index('ix_api_keys_user_id', 'api_keys', ['user_id'])
-    op.create_index('ix_api_keys_organization', 'api_keys', ['organization'])
-    op.create_index('ix_api_keys_is_active', 'api_keys', ['is_active'])
-    op.create_index('ix_api_keys_created_at', 'api_keys', ['created_at'])
-    op.create_index('ix_api_keys_expires_at', 'api_keys', ['expires_at'])
-    
+    _create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'], unique=True)
+    _create_index('ix_api_keys_key_prefix', 'api_keys', ['key_prefix'])
+    _create_index('ix_api_keys_user_id', 'api_keys', ['user_id'])
+    _create_index('ix_api_keys_organization', 'api_keys', ['organization'])
+    _create_index('ix_api_keys_is_active', 'api_keys', ['is_active'])
+    _create_index('ix_api_keys_created_at', 'api_keys', ['created_at'])
+    _create_index('ix_api_keys_expires_at', 'api_keys', ['expires_at'])
+
     # Add composite index for common queries
-    op.create_index('ix_api_keys_active_lookup', 'api_keys', ['is_active', 'revoked_at', 'expires_at'])
+    _create_index('ix_api_keys_active_lookup', 'api_keys', ['is_active', 'revoked_at', 'expires_at'])
 
 
 def downgrade() -> None:
     """Drop API keys table."""
     # Drop indexes
-    op.drop_index('ix_api_keys_active_lookup', table_name='api_keys')
-    op.drop_index('ix_api_keys_expires_at', table_name='api_keys')
-    op.drop_index('ix_api_keys_created_at', table_name='api_keys')
-    op.drop_index('ix_api_keys_is_active', table_name='api_keys')
-    op.drop_index('ix_api_keys_organization', table_name='api_keys')
-    op.drop_index('ix_api_keys_user_id', table_name='api_keys')
-    op.drop_index('ix_api_keys_key_prefix', table_name='api_keys')
-    op.drop_index('ix_api_keys_key_hash', table_name='api_keys')
+    _drop_index('ix_api_keys_active_lookup', 'api_keys')
+    _drop_index('ix_api_keys_expires_at', 'api_keys')
+    _drop_index('ix_api_keys_created_at', 'api_keys')
+    _drop_index('ix_api_keys_is_active', 'api_keys')
+    _drop_index('ix_api_keys_organization', 'api_keys')
+    _drop_index('ix_api_keys_user_id', 'api_keys')
+    _drop_index('ix_api_keys_key_prefix', 'api_keys')
+    _drop_index('ix_api_keys_key_hash', 'api_keys')
     
     # Drop table
     op.drop_table('api_keys')
\ No newline at end of file
@@ -14,18 +14,41 @@ down_revision = '002_add_api_key_table'
 branch_labels = None
 depends_on = None
 
+
+def _create_index(name, table, columns):
+    """Create an index, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} ({', '.join(columns)})"
+        )
+    else:
+        op.create_index(name, table, columns)
+
+
+def _drop_index(name, table):
+    """Drop an index, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("COMMIT")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    else:
+        op.drop_index(name, table_name=table)
+
+
 def upgrade():
     """Add performance indexes for frequently queried columns."""
     # Jobs table indexes (ix_jobs_api_key and ix_jobs_status already exist from 001)
-    op.create_index(op.f('ix_jobs_created_at'), 'jobs', ['created_at'])
-    op.create_index(op.f('ix_jobs_status_api_key'), 'jobs', ['status', 'api_key'])
-    op.create_index(op.f('ix_jobs_api_key_created_at'), 'jobs', ['api_key', 'created_at'])
+    _create_index('ix_jobs_created_at', 'jobs', ['created_at'])
+    _create_index('ix_jobs_status_api_key', 'jobs', ['status', 'api_key'])
+    _create_index('ix_jobs_api_key_created_at', 'jobs', ['api_key', 'created_at'])
     # API keys indexes already created in migration 002
 
 def downgrade():
     """Remove performance indexes."""
     # Jobs table indexes (only drop ones added by this migration)
-    op.drop_index(op.f('ix_jobs_api_key_created_at'), table_name='jobs')
-    op.drop_index(op.f('ix_jobs_status_api_key'), table_name='jobs')
-    op.drop_index(op.f('ix_jobs_created_at'), table_name='jobs')
+    _drop_index('ix_jobs_api_key_created_at', 'jobs')
+    _drop_index('ix_jobs_status_api_key', 'jobs')
+    _drop_index('ix_jobs_created_at', 'jobs')
     # API keys indexes managed by migration 002
\ No newline at end of file
@@ -32,8 +32,36 @@ def upgrade() -> None:
     # Add processing_stats column for detailed stats (JSON)
     op.add_column('jobs', sa.Column('processing_stats', sa.JSON(), nullable=True))
 
-    # Sync current_stage with existing stage values
-    op.execute("UPDATE jobs SET current_stage = stage WHERE current_stage IS NULL")
+    # Sync current_stage with existing stage values. Thanks to the
+    # server_default only rows with a legacy non-null stage need touching.
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Backfill in bounded batches, committing between them, so the
+        # migration never holds row locks on the whole jobs table and WAL
+        # pressure is spread over the migration window.
+        batch_size = 10_000
+        while True:
+            result = bind.execute(
+                sa.text(
+                    "UPDATE jobs SET current_stage = stage "
+                    "WHERE id IN ("
+                    "  SELECT id FROM jobs "
+                    "  WHERE current_stage IS NULL AND stage IS NOT NULL "
+                    "  LIMIT :batch_size"
+                    ")"
+                ),
+                {"batch_size": batch_size},
+            )
+            bind.execute(sa.text("COMMIT"))
+            if result.rowcount < batch_size:
+                break
+    else:
+        # SQLite locks the whole database per statement anyway; a single
+        # UPDATE is the cheapest option.
+        op.execute(
+            "UPDATE jobs SET current_stage = stage "
+            "WHERE current_stage IS NULL AND stage IS NOT NULL"
+        )
 
 
 def downgrade() -> None:
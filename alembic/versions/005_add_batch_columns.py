@@ -26,12 +26,25 @@ def upgrade() -> None:
     # Add batch_index column for ordering within a batch
     op.add_column('jobs', sa.Column('batch_index', sa.Integer(), nullable=True))
 
-    # Create index for batch_id for faster batch queries
-    op.create_index('ix_jobs_batch_id', 'jobs', ['batch_id'])
+    # Create index for batch_id for faster batch queries; CONCURRENTLY on
+    # PostgreSQL so the build does not block writes to jobs.
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_batch_id "
+            "ON jobs (batch_id)"
+        )
+    else:
+        op.create_index('ix_jobs_batch_id', 'jobs', ['batch_id'])
 
 
 def downgrade() -> None:
     """Remove batch columns from jobs table."""
-    op.drop_index('ix_jobs_batch_id', 'jobs')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("COMMIT")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_batch_id")
+    else:
+        op.drop_index('ix_jobs_batch_id', 'jobs')
     op.drop_column('jobs', 'batch_index')
     op.drop_column('jobs', 'batch_id')
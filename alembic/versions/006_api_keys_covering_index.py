@@ -0,0 +1,58 @@
+"""Add covering index for API key auth lookups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-02-03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns read by the auth hot path; INCLUDE-ing them makes the key_hash
+# lookup an index-only scan, skipping the heap fetch entirely.
+_COVERING_COLUMNS = (
+    "id, is_active, is_admin, revoked_at, expires_at, user_id, organization, "
+    "max_concurrent_jobs, monthly_limit_minutes, total_requests, last_used_at, name"
+)
+
+
+def upgrade() -> None:
+    """Add covering index for the key_hash auth lookup."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # INCLUDE indexes are PostgreSQL-only; SQLite keeps the plain
+        # unique index from migration 002.
+        return
+
+    # The index is deliberately not partial on is_active/revoked_at: the
+    # auth query has to see inactive and revoked rows so is_valid() can
+    # distinguish and log them, and a partial index would never match
+    # that query's plan.
+    # CONCURRENTLY cannot run inside a transaction block
+    op.execute("COMMIT")
+    op.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys_key_hash_covering "
+        f"ON api_keys (key_hash) INCLUDE ({_COVERING_COLUMNS})"
+    )
+    # The unique ix_api_keys_key_hash from migration 002 is kept: it still
+    # enforces key_hash uniqueness; the planner uses the covering index for
+    # the auth query's column set.
+
+
+def downgrade() -> None:
+    """Remove the covering index."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("COMMIT")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_api_keys_key_hash_covering")
@@ -0,0 +1,58 @@
+"""Fuse jobs listing indexes into one composite index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-02-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _execute(sql: str) -> None:
+    """Run index DDL, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(sql.replace("INDEX", "INDEX CONCURRENTLY", 1))
+    else:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    """Replace the two partial listing indexes with one composite index.
+
+    The dominant read pattern is "recent jobs for this api_key, optionally
+    filtered by status, ordered by created_at DESC". A single
+    (api_key, status, created_at DESC) index serves the filter and the sort
+    in one bounded index-range scan; its (api_key) prefix also covers every
+    lookup the dropped indexes handled.
+    """
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_api_key_status_created_at "
+        "ON jobs (api_key, status, created_at DESC)"
+    )
+    _execute("DROP INDEX IF EXISTS ix_jobs_api_key_created_at")
+    _execute("DROP INDEX IF EXISTS ix_jobs_status_api_key")
+
+
+def downgrade() -> None:
+    """Restore the separate indexes from migration 003."""
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_api_key_created_at "
+        "ON jobs (api_key, created_at)"
+    )
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_api_key "
+        "ON jobs (status, api_key)"
+    )
+    _execute("DROP INDEX IF EXISTS ix_jobs_api_key_status_created_at")
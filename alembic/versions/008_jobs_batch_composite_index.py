@@ -0,0 +1,49 @@
+"""Replace batch_id index with composite (batch_id, batch_index)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-02-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _execute(sql: str) -> None:
+    """Run index DDL, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(sql.replace("INDEX", "INDEX CONCURRENTLY", 1))
+    else:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    """Make batch listing pre-sorted at the index level.
+
+    Listing a batch's jobs orders by batch_index; the single-column
+    batch_id index forced a post-fetch sort. The composite
+    (batch_id, batch_index) serves the ordered scan directly and its
+    batch_id prefix still covers equality-only lookups.
+    """
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_batch_id_index "
+        "ON jobs (batch_id, batch_index)"
+    )
+    _execute("DROP INDEX IF EXISTS ix_jobs_batch_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column batch_id index from migration 005."""
+    _execute("CREATE INDEX IF NOT EXISTS ix_jobs_batch_id ON jobs (batch_id)")
+    _execute("DROP INDEX IF EXISTS ix_jobs_batch_id_index")
@@ -0,0 +1,49 @@
+"""Add partial index over active jobs
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-02-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _execute(sql: str) -> None:
+    """Run index DDL, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(sql.replace("INDEX", "INDEX CONCURRENTLY", 1))
+    else:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    """Index only queued/processing jobs.
+
+    Most jobs rows sit in a terminal state; the dispatcher and
+    concurrency-limit checks only ever scan the active ones. The partial
+    index stays a few pages big regardless of table growth, so active-job
+    scans remain near-instant. Both SQLite and PostgreSQL support partial
+    indexes with this predicate.
+    """
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_active_status "
+        "ON jobs (created_at, api_key) "
+        "WHERE status IN ('queued', 'processing')"
+    )
+
+
+def downgrade() -> None:
+    """Remove the partial active-jobs index."""
+    _execute("DROP INDEX IF EXISTS ix_jobs_active_status")
@@ -0,0 +1,58 @@
+"""Convert jobs JSON columns to JSONB on PostgreSQL
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_JSON_COLUMNS = (
+    'input_metadata',
+    'output_metadata',
+    'options',
+    'operations',
+    'processing_stats',
+    'error_details',
+    'webhook_events',
+)
+
+
+def upgrade() -> None:
+    """Store jobs JSON payloads as JSONB.
+
+    JSONB is parsed once at write time and handed to the client pre-parsed
+    over the binary protocol, instead of being re-parsed from text on
+    every read. SQLite has no JSONB type, so this is PostgreSQL-only; the
+    model maps the columns with a dialect variant.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in _JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE jobs ALTER COLUMN {column} "
+            f"TYPE JSONB USING {column}::jsonb"
+        )
+
+
+def downgrade() -> None:
+    """Revert jobs JSON payloads to text json."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in _JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE jobs ALTER COLUMN {column} "
+            f"TYPE JSON USING {column}::json"
+        )
@@ -0,0 +1,48 @@
+"""Add covering index for the paginated jobs listing
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make the jobs listing query index-only on PostgreSQL.
+
+    The listing endpoint returns a fixed column set per row; carrying
+    those columns in the index INCLUDE list removes the heap fetch per
+    row. INCLUDE is PostgreSQL-only; SQLite keeps the plain
+    idx_job_api_key_created index from migration 001.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block
+    op.execute("COMMIT")
+    op.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_api_key_created_cov "
+        "ON jobs (api_key, created_at) "
+        "INCLUDE (id, status, priority, progress, stage, "
+        "started_at, completed_at, eta_seconds)"
+    )
+
+
+def downgrade() -> None:
+    """Remove the covering listing index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("COMMIT")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_job_api_key_created_cov")
@@ -0,0 +1,62 @@
+"""Store jobs status/priority as native PG enums
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert status/priority from text to native enum types.
+
+    Native enums are stored as a 4-byte OID and compared as integers,
+    roughly halving index size and heap traffic for these columns versus
+    variable-length text. SQLite has no enum type, so the columns stay
+    plain strings there; the model maps them with a dialect variant.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "CREATE TYPE job_status AS ENUM "
+        "('queued', 'processing', 'completed', 'failed', 'cancelled')"
+    )
+    op.execute(
+        "CREATE TYPE job_priority AS ENUM ('low', 'normal', 'high')"
+    )
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN status "
+        "TYPE job_status USING status::job_status"
+    )
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN priority "
+        "TYPE job_priority USING priority::job_priority"
+    )
+
+
+def downgrade() -> None:
+    """Revert status/priority to text columns."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN status TYPE VARCHAR USING status::text"
+    )
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN priority "
+        "TYPE VARCHAR USING priority::text"
+    )
+    op.execute("DROP TYPE job_status")
+    op.execute("DROP TYPE job_priority")
@@ -0,0 +1,69 @@
+"""Key the API-key auth covering index on key_prefix
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns read by the auth hot path. key_hash moves into the INCLUDE
+# list: the service now filters by key_prefix and verifies the hash in
+# Python, so the index key shrinks from 64 hex chars to 8.
+_COVERING_COLUMNS = (
+    "key_hash, id, is_active, is_admin, revoked_at, expires_at, user_id, "
+    "organization, max_concurrent_jobs, monthly_limit_minutes, "
+    "total_requests, last_used_at, name"
+)
+
+
+def upgrade() -> None:
+    """Replace the key_hash-keyed covering index with a prefix-keyed one."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # INCLUDE indexes are PostgreSQL-only; SQLite serves the prefix
+        # lookup from the plain key_prefix index of migration 002.
+        return
+
+    # Like migration 006, the index is not partial: the auth query must
+    # see inactive and revoked rows, so a WHERE clause here would stop
+    # the planner from ever choosing the index.
+    # CONCURRENTLY cannot run inside a transaction block
+    op.execute("COMMIT")
+    op.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys_key_prefix_covering "
+        f"ON api_keys (key_prefix) INCLUDE ({_COVERING_COLUMNS})"
+    )
+    op.execute(
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_api_keys_key_hash_covering"
+    )
+    # The unique ix_api_keys_key_hash from migration 002 is kept: it
+    # still enforces key_hash uniqueness.
+
+
+def downgrade() -> None:
+    """Restore the key_hash-keyed covering index."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("COMMIT")
+    op.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys_key_hash_covering "
+        "ON api_keys (key_hash) INCLUDE (id, is_active, is_admin, revoked_at, "
+        "expires_at, user_id, organization, max_concurrent_jobs, "
+        "monthly_limit_minutes, total_requests, last_used_at, name)"
+    )
+    op.execute(
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_api_keys_key_prefix_covering"
+    )
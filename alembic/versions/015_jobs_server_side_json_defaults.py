@@ -0,0 +1,62 @@
+"""Move jobs JSON container defaults server-side
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DEFAULTS = (
+    ('input_metadata', "'{}'"),
+    ('output_metadata', "'{}'"),
+    ('options', "'{}'"),
+    ('operations', "'[]'"),
+    ('webhook_events', '\'["complete", "error"]\''),
+)
+
+
+def upgrade() -> None:
+    """Let the database fill empty-container defaults.
+
+    The ORM previously serialized a fresh {} / [] from Python on every
+    INSERT; with a server default the column is simply omitted from the
+    statement when unset. SQLite needs a table rebuild for default
+    changes, which batch_alter_table handles.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        for column, default in _DEFAULTS:
+            op.alter_column('jobs', column, server_default=sa.text(default))
+    else:
+        with op.batch_alter_table('jobs') as batch:
+            for column, default in _DEFAULTS:
+                batch.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    server_default=sa.text(default),
+                )
+
+
+def downgrade() -> None:
+    """Drop the server-side defaults (Python-side defaults resume)."""
+    if op.get_bind().dialect.name == 'postgresql':
+        for column, _ in _DEFAULTS:
+            op.alter_column('jobs', column, server_default=None)
+    else:
+        with op.batch_alter_table('jobs') as batch:
+            for column, _ in _DEFAULTS:
+                batch.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    server_default=None,
+                )
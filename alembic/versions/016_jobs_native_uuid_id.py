@@ -0,0 +1,47 @@
+"""Store jobs.id as a native uuid
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert jobs.id from CHAR(36) text to native uuid storage.
+
+    On PostgreSQL the native type stores 16 bytes instead of 36 and
+    travels the binary protocol, so no per-row Python conversion runs.
+    On SQLite sqlalchemy.Uuid binds undashed 32-char hex, so existing
+    dashed values are rewritten to match.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE jobs ALTER COLUMN id TYPE uuid USING id::uuid")
+    else:
+        op.execute("UPDATE jobs SET id = replace(id, '-', '')")
+
+
+def downgrade() -> None:
+    """Revert jobs.id to dashed CHAR(36) text."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE jobs ALTER COLUMN id TYPE varchar(36) USING id::text"
+        )
+    else:
+        op.execute(
+            "UPDATE jobs SET id = "
+            "substr(id, 1, 8) || '-' || substr(id, 9, 4) || '-' || "
+            "substr(id, 13, 4) || '-' || substr(id, 17, 4) || '-' || "
+            "substr(id, 21)"
+        )
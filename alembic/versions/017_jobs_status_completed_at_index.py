@@ -0,0 +1,47 @@
+"""Add composite (status, completed_at) index for cleanup scans
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _execute(sql: str) -> None:
+    """Run index DDL, using CONCURRENTLY on PostgreSQL to avoid table locks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(sql.replace("INDEX", "INDEX CONCURRENTLY", 1))
+    else:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    """Index the cleanup predicate.
+
+    cleanup_old_jobs filters on status IN (terminal) AND
+    completed_at < cutoff; without this composite the query degrades to
+    a full table scan as the jobs table grows. Status first matches the
+    equality-set-then-range shape of the predicate.
+    """
+    _execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_completed_at "
+        "ON jobs (status, completed_at)"
+    )
+
+
+def downgrade() -> None:
+    """Remove the cleanup index."""
+    _execute("DROP INDEX IF EXISTS ix_jobs_status_completed_at")
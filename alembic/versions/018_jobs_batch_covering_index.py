@@ -0,0 +1,59 @@
+"""Add covering (batch_id, api_key) index for batch queries
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-02-25
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns read by the batch status aggregation, the per-job summary
+# listing, and batch cancel.
+_COVERING_COLUMNS = (
+    "id, status, progress, batch_index, worker_id, created_at, "
+    "started_at, completed_at"
+)
+
+
+def upgrade() -> None:
+    """Index the (batch_id, api_key) filter used by batch endpoints.
+
+    Both get_batch_status and cancel_batch filter on batch_id AND
+    api_key; the plain batch_id index still works but needs heap
+    fetches for the ownership check and every returned column. On
+    PostgreSQL the INCLUDE list makes these index-only scans; SQLite
+    gets a plain composite index.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY cannot run inside a transaction block
+        op.execute("COMMIT")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_batch_api_cover "
+            f"ON jobs (batch_id, api_key) INCLUDE ({_COVERING_COLUMNS})"
+        )
+    else:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_jobs_batch_api_cover "
+            "ON jobs (batch_id, api_key)"
+        )
+
+
+def downgrade() -> None:
+    """Remove the batch covering index."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("COMMIT")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_batch_api_cover")
+    else:
+        op.execute("DROP INDEX IF EXISTS ix_jobs_batch_api_cover")
@@ -27,6 +27,17 @@ except ImportError:
         """
         __slots__ = ('documentation',)
 
+        # Instances are interned per documentation string: annotation sites
+        # with identical text share one object for the process lifetime, and
+        # __eq__/__hash__ become effectively identity checks.
+        _cache: dict = {}
+
+        def __new__(cls, documentation: str) -> "Doc":
+            cached = cls._cache.get(documentation)
+            if cached is None:
+                cached = cls._cache.setdefault(documentation, super().__new__(cls))
+            return cached
+
         def __init__(self, documentation: str) -> None:
             self.documentation = documentation
 
@@ -3,10 +3,12 @@ Production-grade configuration management for Rendiff FFmpeg API.
 
 Handles all application settings with validation, type safety, and environment-based configuration.
 """
+import ipaddress
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from types import SimpleNamespace
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -74,7 +76,7 @@ class Settings(BaseSettings):
     RATE_LIMIT_PERIOD: int = 3600  # seconds
     
     # CORS
-    CORS_ORIGINS: List[str] = Field(default_factory=lambda: ["http://localhost", "https://localhost"])
+    CORS_ORIGINS: Tuple[str, ...] = Field(default_factory=lambda: ("http://localhost", "https://localhost"))
     
     # Monitoring
     ENABLE_METRICS: bool = True
@@ -87,6 +89,7 @@ class Settings(BaseSettings):
     MAX_JOB_DURATION: int = 21600  # 6 hours
     MAX_CONCURRENT_JOBS_PER_KEY: int = 10
     MAX_OPERATIONS_PER_JOB: int = 50  # Maximum operations per conversion job
+    MAX_BATCH_BYTES: int = 1024 * 1024  # Maximum batch request body size (1MB)
     JOB_RETENTION_DAYS: int = 7
     
     # Webhooks
@@ -102,7 +105,7 @@ class Settings(BaseSettings):
     @validator("CORS_ORIGINS", pre=True)
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(origin.strip() for origin in v.split(","))
         return v
     
     @validator("TEMP_PATH", "STORAGE_PATH")
@@ -111,16 +114,39 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
     
-    @property
-    def ip_whitelist_parsed(self) -> List[str]:
-        """Parse IP whitelist."""
+    @cached_property
+    def ip_whitelist_parsed(self) -> Tuple[str, ...]:
+        """Parse IP whitelist once into an immutable tuple."""
         if not self.ENABLE_IP_WHITELIST:
-            return []
-        return [ip.strip() for ip in self.IP_WHITELIST.split(",")]
-    
-    @property
+            return ()
+        return tuple(ip.strip() for ip in self.IP_WHITELIST.split(","))
+
+    @cached_property
+    def ip_whitelist_networks(self) -> tuple:
+        """
+        IP whitelist pre-parsed into (version, network_int, netmask_int)
+        tuples, computed once so per-request containment checks are plain
+        integer operations instead of ipaddress object construction.
+        """
+        if not self.ENABLE_IP_WHITELIST:
+            return ()
+        networks = []
+        for entry in self.IP_WHITELIST.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            try:
+                net = ipaddress.ip_network(entry, strict=False)
+            except ValueError:
+                continue
+            networks.append(
+                (net.version, int(net.network_address), int(net.netmask))
+            )
+        return tuple(networks)
+    
+    @cached_property
     def database_url_async(self) -> str:
-        """Convert database URL to async version."""
+        """Convert database URL to async version (computed once)."""
         if self.DATABASE_URL.startswith("postgresql://"):
             return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
         elif self.DATABASE_URL.startswith("sqlite://"):
@@ -133,11 +159,28 @@ class Settings(BaseSettings):
         return self.REDIS_URL
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
 
 
-# Global settings instance
-settings = get_settings()
\ No newline at end of file
+def _freeze(settings_obj: Settings) -> SimpleNamespace:
+    """
+    Snapshot validated settings into a plain namespace.
+
+    Hot paths read settings attributes on every request; a SimpleNamespace
+    serves them via C-level attribute lookup instead of Pydantic's field
+    resolution. Computed properties are materialized into the snapshot so
+    all existing attribute access keeps working.
+    """
+    data = {name: getattr(settings_obj, name) for name in settings_obj.model_fields}
+    data["ip_whitelist_parsed"] = settings_obj.ip_whitelist_parsed
+    data["ip_whitelist_networks"] = settings_obj.ip_whitelist_networks
+    data["database_url_async"] = settings_obj.database_url_async
+    data["VALKEY_URL"] = settings_obj.VALKEY_URL
+    return SimpleNamespace(**data)
+
+
+# Global settings instance (frozen snapshot of the validated Settings)
+settings = _freeze(get_settings())
\ No newline at end of file
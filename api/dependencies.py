@@ -6,6 +6,10 @@ This module uses modern FastAPI 0.124+ patterns including:
 - Dependency scopes for proper resource management
 - Enhanced type safety with Pydantic 2.10+
 """
+import asyncio
+import hashlib
+import time
+import types
 from typing import Optional, Annotated, AsyncGenerator
 
 from annotated_doc import Doc
@@ -14,11 +18,160 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from api.config import settings
-from api.models.database import get_session
+from api.models.database import get_session, get_readonly_session
 
 logger = structlog.get_logger()
 
 
+# In-process TTL cache for validated API keys. Entries are keyed by the
+# SHA-256 digest of the raw key and hold (expires_at, api_key_model)
+# snapshots, so high-QPS clients reusing a key hit the DB at most once
+# per TTL window instead of once per request.
+_API_KEY_CACHE_TTL = 60.0  # seconds
+_API_KEY_CACHE_MAX_SIZE = 10_000
+_api_key_cache: dict = {}
+_api_key_cache_lock = asyncio.Lock()
+
+# Usage updates are coalesced per key and flushed in the background,
+# replacing the per-request UPDATE with one batched statement per key
+# every flush interval.
+_USAGE_FLUSH_INTERVAL = 10.0  # seconds
+_pending_usage: dict = {}  # key_id -> [request_count, last_seen_datetime]
+_usage_flush_task: Optional[asyncio.Task] = None
+
+
+# Auth failure responses are constants; pre-build the exceptions so the
+# error paths allocate nothing per request (relevant under credential
+# stuffing, where failures dominate).
+_AUTH_REQUIRED_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail={
+        "error": "authentication_required",
+        "message": "API key required",
+        "help": "Include X-API-Key header or Authorization: Bearer <key>"
+    },
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_INVALID_KEY_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail={
+        "error": "invalid_api_key",
+        "message": "Invalid API key"
+    },
+)
+
+# Cap invalid-key warnings so adversarial traffic (credential stuffing)
+# cannot amplify logging cost; at most _INVALID_KEY_LOG_LIMIT warnings
+# per window, the rest are dropped silently.
+_INVALID_KEY_LOG_LIMIT = 100
+_INVALID_KEY_LOG_WINDOW = 60.0  # seconds
+_invalid_key_log_window_start = 0.0
+_invalid_key_log_count = 0
+
+
+def _should_log_invalid_key() -> bool:
+    """Token-bucket style limiter for invalid API key warnings."""
+    global _invalid_key_log_window_start, _invalid_key_log_count
+
+    now = time.monotonic()
+    if now - _invalid_key_log_window_start >= _INVALID_KEY_LOG_WINDOW:
+        _invalid_key_log_window_start = now
+        _invalid_key_log_count = 0
+
+    if _invalid_key_log_count >= _INVALID_KEY_LOG_LIMIT:
+        return False
+
+    _invalid_key_log_count += 1
+    return True
+
+
+def invalidate_api_key_cache() -> None:
+    """Drop all cached API key validations (e.g. after revoke/update)."""
+    _api_key_cache.clear()
+
+
+def _record_api_key_usage(key_id) -> None:
+    """Accumulate a usage tick for a key and ensure the flush task runs."""
+    global _usage_flush_task
+    from datetime import datetime
+
+    entry = _pending_usage.get(key_id)
+    if entry:
+        entry[0] += 1
+        entry[1] = datetime.utcnow()
+    else:
+        _pending_usage[key_id] = [1, datetime.utcnow()]
+
+    if _usage_flush_task is None or _usage_flush_task.done():
+        _usage_flush_task = asyncio.create_task(_flush_api_key_usage())
+
+
+async def flush_pending_api_key_usage() -> None:
+    """Flush accumulated usage counters with one batched UPDATE per key.
+
+    Called periodically by the background flusher and once from lifespan
+    shutdown so no usage ticks are lost on a clean exit.
+    """
+    from sqlalchemy import update
+
+    from api.models.api_key import APIKey
+    from api.models.database import AsyncSessionLocal
+
+    pending = dict(_pending_usage)
+    _pending_usage.clear()
+    if not pending:
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            for key_id, (count, last_seen) in pending.items():
+                await session.execute(
+                    update(APIKey)
+                    .where(APIKey.id == key_id)
+                    .values(
+                        total_requests=APIKey.total_requests + count,
+                        last_used_at=last_seen,
+                    )
+                )
+            await session.commit()
+    except Exception as e:
+        logger.warning("Failed to flush API key usage stats", error=str(e))
+
+
+async def _flush_api_key_usage() -> None:
+    """Background loop draining the usage buffer every flush interval."""
+    while _pending_usage:
+        await asyncio.sleep(_USAGE_FLUSH_INTERVAL)
+        await flush_pending_api_key_usage()
+
+
+async def _validate_api_key_cached(db: AsyncSession, api_key: str):
+    """Validate an API key, serving repeat lookups from the TTL cache."""
+    from api.services.api_key import APIKeyService
+
+    cache_key = hashlib.sha256(api_key.encode()).digest()
+    now = time.monotonic()
+
+    async with _api_key_cache_lock:
+        cached = _api_key_cache.get(cache_key)
+        if cached and cached[0] > now:
+            _record_api_key_usage(cached[1].id)
+            return cached[1]
+
+    api_key_model = await APIKeyService.validate_api_key(
+        db, api_key, update_usage=False
+    )
+
+    if api_key_model:
+        async with _api_key_cache_lock:
+            if len(_api_key_cache) >= _API_KEY_CACHE_MAX_SIZE:
+                _api_key_cache.clear()
+            _api_key_cache[cache_key] = (now + _API_KEY_CACHE_TTL, api_key_model)
+        _record_api_key_usage(api_key_model.id)
+
+    return api_key_model
+
+
 # Type aliases for cleaner code
 APIKey = Annotated[str, Doc("Valid API key for authentication")]
 OptionalAPIKey = Annotated[Optional[str], Doc("Optional API key from headers")]
@@ -43,6 +196,24 @@ DatabaseSession = Annotated[
 ]
 
 
+async def get_readonly_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get read-only database session dependency.
+
+    Backed by the AUTOCOMMIT read pool; use for handlers that only
+    query, so they don't hold write-pool connections or snapshots.
+    """
+    async for session in get_readonly_session():
+        yield session
+
+
+ReadOnlySession = Annotated[
+    AsyncSession,
+    Depends(get_readonly_db),
+    Doc("Read-only async database session for stat queries")
+]
+
+
 async def get_api_key(
     x_api_key: Annotated[
         Optional[str],
@@ -90,7 +261,7 @@ async def require_api_key(
 
     This dependency:
     - Validates API key format and existence
-    - Uses timing attack protection
+    - Uses constant-time hash comparison for timing attack protection
     - Supports IP whitelist validation
     - Updates API key usage statistics
 
@@ -105,67 +276,38 @@ async def require_api_key(
         return "anonymous"
 
     if not api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "authentication_required",
-                "message": "API key required",
-                "help": "Include X-API-Key header or Authorization: Bearer <key>"
-            },
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Validate API key against database with timing attack protection
-    import asyncio
-    from api.services.api_key import APIKeyService
-
-    # Always take the same amount of time regardless of key validity
-    start_time = asyncio.get_event_loop().time()
+        raise _AUTH_REQUIRED_EXC
 
-    api_key_model = await APIKeyService.validate_api_key(
-        db, api_key, update_usage=True
-    )
-
-    # Ensure constant time execution (minimum 100ms)
-    elapsed = asyncio.get_event_loop().time() - start_time
-    min_time = 0.1  # 100ms
-    if elapsed < min_time:
-        await asyncio.sleep(min_time - elapsed)
+    # Validate API key, serving repeat lookups from the in-process TTL
+    # cache. Timing attack protection comes from the constant-time hash
+    # comparison inside validate_api_key, so no artificial delay is needed.
+    api_key_model = await _validate_api_key_cached(db, api_key)
 
     if not api_key_model:
-        logger.warning(
-            "Invalid API key attempted",
-            api_key_prefix=api_key[:8] + "..." if len(api_key) > 8 else api_key,
-            client_ip=request.client.host if request.client else "unknown",
-        )
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "invalid_api_key",
-                "message": "Invalid API key"
-            },
-        )
+        if _should_log_invalid_key():
+            logger.warning(
+                "Invalid API key attempted",
+                api_key_prefix=api_key[:8],
+                client_ip=request.client.host if request.client else "unknown",
+            )
+        raise _INVALID_KEY_EXC
 
     # Check IP whitelist if enabled
     if settings.ENABLE_IP_WHITELIST:
         import ipaddress
         client_ip = request.client.host if request.client else "unknown"
 
-        # Validate client IP against CIDR ranges
+        # Validate client IP against the pre-parsed CIDR ranges; containment
+        # is a single integer AND per network, no per-request parsing.
         try:
             client_ip_obj = ipaddress.ip_address(client_ip)
-            allowed = False
-
-            for allowed_range in settings.ip_whitelist_parsed:
-                try:
-                    if client_ip_obj in ipaddress.ip_network(allowed_range, strict=False):
-                        allowed = True
-                        break
-                except (ipaddress.AddressValueError, ipaddress.NetmaskValueError):
-                    # Fallback to string comparison for invalid CIDR
-                    if client_ip.startswith(allowed_range):
-                        allowed = True
-                        break
+            client_version = client_ip_obj.version
+            client_int = int(client_ip_obj)
+
+            allowed = any(
+                version == client_version and (client_int & mask) == net
+                for version, net, mask in settings.ip_whitelist_networks
+            )
 
             if not allowed:
                 logger.warning(
@@ -199,6 +341,19 @@ RequiredAPIKey = Annotated[
 ]
 
 
+# Read-only anonymous user, shared across requests when API keys are
+# disabled (dev/test) so no per-request dict is constructed.
+_ANONYMOUS_USER = types.MappingProxyType({
+    "id": "anonymous",
+    "api_key": "anonymous",
+    "role": "anonymous",
+    "quota": {
+        "concurrent_jobs": 1,
+        "monthly_minutes": 100,
+    },
+})
+
+
 async def get_current_user(
     request: Request,
     api_key: RequiredAPIKey,
@@ -208,20 +363,15 @@ async def get_current_user(
 
     Returns a dictionary containing user details, quotas, and usage statistics.
     """
+    if not settings.ENABLE_API_KEYS:
+        return _ANONYMOUS_USER
+
     # Get API key model from request state (set by require_api_key)
     api_key_model = getattr(request.state, 'api_key_model', None)
 
     if not api_key_model:
         # Fallback for anonymous access
-        return {
-            "id": "anonymous",
-            "api_key": api_key,
-            "role": "anonymous",
-            "quota": {
-                "concurrent_jobs": 1,
-                "monthly_minutes": 100,
-            },
-        }
+        return _ANONYMOUS_USER
 
     return {
         "id": api_key_model.user_id or f"api_key_{api_key_model.id}",
@@ -30,6 +30,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         enable_xss_protection: bool = True,
         enable_frame_options: bool = True,
         frame_options: str = "DENY",
+        exempt_paths: tuple = ("/metrics",),
     ):
         super().__init__(app)
         self.csp_policy = csp_policy
@@ -39,9 +40,14 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         self.enable_xss_protection = enable_xss_protection
         self.enable_frame_options = enable_frame_options
         self.frame_options = frame_options
+        self.exempt_paths = exempt_paths
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Add security headers to response."""
+        # Skip header injection for exempt paths (e.g. Prometheus scrapes)
+        if request.url.path.startswith(self.exempt_paths):
+            return await call_next(request)
+
         response = await call_next(request)
         
         # Content Security Policy
@@ -95,12 +101,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         period: int = 3600,  # 1 hour
         enabled: bool = True,
         redis_client = None,  # Redis client for distributed rate limiting
+        exempt_paths: tuple = ("/metrics", "/api/v1/health"),
     ):
         super().__init__(app)
         self.calls = calls
         self.period = period
         self.enabled = enabled
         self.redis_client = redis_client
+        self.exempt_paths = exempt_paths
         self.clients = {}  # Fallback in-memory store
         
         # Default quotas for different API key tiers
@@ -115,7 +123,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Apply enhanced rate limiting with API key quotas."""
         if not self.enabled:
             return await call_next(request)
-        
+
+        # Never rate-limit metrics scrapes or liveness probes
+        if request.url.path.startswith(self.exempt_paths):
+            return await call_next(request)
+
         # Get client identifier (IP + API key if available)
         client_ip = request.client.host
         if "X-Forwarded-For" in request.headers:
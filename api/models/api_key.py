@@ -1,18 +1,41 @@
 """
 API Key model for authentication.
 """
+import base64
 import secrets
 import hashlib
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, LargeBinary, Text
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import reconstructor
 from sqlalchemy.sql import func
 
 from api.models.database import Base
 
+# Module-level alias: hashlib.sha256 dispatches to OpenSSL's SHA-NI
+# accelerated implementation where the CPU supports it; binding it once
+# also skips the module attribute lookup on every hash.
+_sha256 = hashlib.sha256
+
+# Sentinel distinguishing "not computed yet" from "no timestamp set" on
+# the precomputed validity fields below.
+_TS_UNSET = object()
+
+
+def _to_ts(value: Optional[datetime]) -> Optional[float]:
+    """Epoch seconds for a stored timestamp; naive values are UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
 
 class APIKey(Base):
     """API Key model for authentication."""
@@ -20,7 +43,9 @@ class APIKey(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(255), nullable=False)
-    key_hash = Column(String(64), nullable=False, unique=True, index=True)
+    # Raw 32-byte SHA-256 digest; half the storage and index footprint of
+    # the former 64-char hex encoding. Use .hex() where text is needed.
+    key_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)
     key_prefix = Column(String(8), nullable=False, index=True)
     
     # User/organization info
@@ -45,7 +70,22 @@ class APIKey(Base):
     # Metadata
     description = Column(Text, nullable=True)
     created_by = Column(String(255), nullable=True)
-    
+
+    # Precomputed epoch seconds for the validity hot path; filled on ORM
+    # load, lazily for transient instances (e.g. cache-snapshot rebuilds).
+    _expires_ts = _TS_UNSET
+    _revoked_ts = _TS_UNSET
+
+    @reconstructor
+    def _init_on_load(self):
+        """Precompute expiry/revocation epochs once per row load.
+
+        is_valid() then compares two floats against time.time() instead
+        of building and subtracting datetime objects per call.
+        """
+        self._expires_ts = _to_ts(self.expires_at)
+        self._revoked_ts = _to_ts(self.revoked_at)
+
     @classmethod
     def generate_key(cls) -> tuple[str, str, str]:
         """
@@ -54,48 +94,77 @@ class APIKey(Base):
         Returns:
             tuple: (raw_key, key_hash, key_prefix) where raw_key should be shown to user only once
         """
-        # Generate 32 random bytes (256 bits)
-        raw_key = secrets.token_urlsafe(32)
-        
-        # Create hash for storage
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-        
+        # Generate 32 random bytes (256 bits) and base64-encode once.
+        # Hashing the encoded bytes before decoding to str avoids the
+        # str->bytes round-trip token_urlsafe would force; the digest
+        # preimage stays the ASCII key, so validation of existing keys
+        # is unaffected.
+        encoded = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=")
+
+        # Create hash for storage (raw digest bytes)
+        key_hash = _sha256(encoded).digest()
+
+        raw_key = encoded.decode("ascii")
+
         # Get prefix for indexing (first 8 chars)
         key_prefix = raw_key[:8]
-        
+
         return raw_key, key_hash, key_prefix
     
     @classmethod
-    def hash_key(cls, raw_key: str) -> str:
-        """Hash a raw key for comparison."""
-        return hashlib.sha256(raw_key.encode()).hexdigest()
-    
-    def is_valid(self) -> bool:
-        """Check if API key is valid (active, not expired, not revoked)."""
-        now = datetime.utcnow()
-        
+    def hash_key(cls, raw_key: str) -> bytes:
+        """Hash a raw key for comparison (raw 32-byte digest).
+
+        hashlib.sha256 dispatches to OpenSSL, which uses the SHA-NI
+        hardware path where available; for short high-entropy keys this
+        is already effectively free, so no faster hash is warranted.
+        """
+        return _sha256(raw_key.encode()).digest()
+
+    @classmethod
+    def hash_keys(cls, raw_keys: list) -> list:
+        """Hash a batch of raw keys (bulk import, expiry sweeps).
+
+        A tight comprehension over the bound constructor keeps per-key
+        interpreter overhead minimal; the digests themselves already run
+        on OpenSSL's hardware-accelerated path.
+        """
+        return [_sha256(raw_key.encode()).digest() for raw_key in raw_keys]
+
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
+        """Check if API key is valid (active, not expired, not revoked).
+
+        Runs on precomputed epoch floats (see _init_on_load); callers
+        that already hold a timestamp can pass it for a consistent
+        reference point across several checks.
+        """
         if not self.is_active:
             return False
-            
-        if self.revoked_at and self.revoked_at <= now:
+
+        if self._revoked_ts is _TS_UNSET or self._expires_ts is _TS_UNSET:
+            self._init_on_load()
+
+        ref = time.time() if now is None else _to_ts(now)
+
+        if self._revoked_ts is not None and self._revoked_ts <= ref:
             return False
-            
-        if self.expires_at and self.expires_at <= now:
+
+        if self._expires_ts is not None and self._expires_ts <= ref:
             return False
-            
+
         return True
-    
-    def is_expired(self) -> bool:
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if API key is expired."""
         if not self.expires_at:
             return False
-        return datetime.utcnow() > self.expires_at
-    
-    def days_until_expiry(self) -> Optional[int]:
+        return (now or datetime.utcnow()) > self.expires_at
+
+    def days_until_expiry(self, now: Optional[datetime] = None) -> Optional[int]:
         """Get days until expiry, or None if no expiry set."""
         if not self.expires_at:
             return None
-        delta = self.expires_at - datetime.utcnow()
+        delta = self.expires_at - (now or datetime.utcnow())
         return max(0, delta.days)
     
     def update_last_used(self):
@@ -107,40 +176,78 @@ class APIKey(Base):
         """Revoke this API key."""
         self.revoked_at = datetime.utcnow()
         self.is_active = False
-    
+        self._revoked_ts = _to_ts(self.revoked_at)
+
     def extend_expiry(self, days: int):
         """Extend expiry by specified days."""
         if self.expires_at:
             self.expires_at += timedelta(days=days)
         else:
             self.expires_at = datetime.utcnow() + timedelta(days=days)
+        self._expires_ts = _to_ts(self.expires_at)
     
-    def to_dict(self, include_sensitive: bool = False) -> dict:
-        """Convert to dictionary for API responses."""
-        data = {
+    def _col(self, name: str):
+        """Column value, or None if the column was deferred at load time.
+
+        The validation path loads instances through load_only so the
+        lookup stays an index-only scan; touching a deferred column on
+        such an instance would trigger a lazy load and raise
+        MissingGreenlet under the async session. Serialization must
+        therefore never read deferred columns directly.
+        """
+        if name in sa_inspect(self).unloaded:
+            return None
+        return getattr(self, name)
+
+    @cached_property
+    def _static_dict(self) -> dict:
+        """Immutable fields of the API response dict, built once per load.
+
+        Only fields that can never change after creation belong here;
+        anything touched by update/revoke/extend stays in to_dict so a
+        reused instance never serves stale values.
+        """
+        created_at = self._col("created_at")
+        return {
             "id": str(self.id),
-            "name": self.name,
             "key_prefix": self.key_prefix,
             "user_id": self.user_id,
             "organization": self.organization,
-            "is_active": self.is_active,
             "is_admin": self.is_admin,
+            "created_at": created_at.isoformat() if created_at else None,
+            "created_by": self._col("created_by"),
+        }
+
+    def to_dict(self, include_sensitive: bool = False) -> dict:
+        """Convert to dictionary for API responses."""
+        # One utcnow and one subtraction cover both expiry-derived
+        # fields instead of a method call (and its own arithmetic) each.
+        exp = self.expires_at
+        if exp is None:
+            is_expired, days_left = False, None
+        else:
+            delta = exp - datetime.utcnow()
+            is_expired = delta.total_seconds() < 0
+            days_left = max(0, delta.days)
+
+        data = {
+            **self._static_dict,
+            "name": self.name,
+            "is_active": self.is_active,
             "max_concurrent_jobs": self.max_concurrent_jobs,
             "monthly_limit_minutes": self.monthly_limit_minutes,
             "total_requests": self.total_requests,
             "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
-            "created_at": self.created_at.isoformat(),
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
             "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
-            "description": self.description,
-            "created_by": self.created_by,
-            "is_expired": self.is_expired(),
-            "days_until_expiry": self.days_until_expiry(),
+            "description": self._col("description"),
+            "is_expired": is_expired,
+            "days_until_expiry": days_left,
         }
-        
+
         if include_sensitive:
-            data["key_hash"] = self.key_hash
-            
+            data["key_hash"] = self.key_hash.hex() if self.key_hash else None
+
         return data
     
     def __repr__(self):
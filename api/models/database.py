@@ -5,6 +5,7 @@ from typing import AsyncGenerator
 import os
 from pathlib import Path
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool, StaticPool
 
@@ -12,6 +13,12 @@ from api.config import settings
 from api.models.job import Base
 from api.utils.database import set_sqlite_pragma
 
+
+def _json_serializer(obj) -> str:
+    """orjson-backed column serializer (3-5x faster than stdlib json)."""
+    return orjson.dumps(obj).decode()
+
+
 # Configure engine based on database type
 if "sqlite" in settings.database_url_async:
     # SQLite specific configuration
@@ -21,15 +28,28 @@ if "sqlite" in settings.database_url_async:
         settings.database_url_async,
         connect_args=connect_args,
         poolclass=poolclass,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 else:
-    # PostgreSQL configuration (kept for compatibility)
+    # PostgreSQL configuration (kept for compatibility).
+    # pool_recycle replaces pool_pre_ping: recycling connections every
+    # 30 minutes avoids a liveness round-trip per checkout. asyncpg's
+    # per-query JIT is disabled because it pessimizes the short OLTP
+    # queries this API issues.
     engine = create_async_engine(
         settings.database_url_async,
-        pool_pre_ping=True,
+        pool_pre_ping=False,
+        pool_recycle=1800,
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         poolclass=NullPool if settings.TESTING else None,
+        connect_args={
+            "server_settings": {"jit": "off"},
+            "command_timeout": 10,
+        },
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 
 # Create session factory
@@ -39,6 +59,35 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only engine for stat/monitoring queries. On PostgreSQL it is a
+# separate small AUTOCOMMIT pool, so pure reads neither hold a
+# transaction snapshot nor compete with the write pool's connections.
+# SQLite has a single lightweight pool; the shared engine is reused.
+if "sqlite" in settings.database_url_async:
+    readonly_engine = engine
+else:
+    readonly_engine = create_async_engine(
+        settings.database_url_async,
+        pool_pre_ping=False,
+        pool_recycle=1800,
+        pool_size=5,
+        max_overflow=5,
+        poolclass=NullPool if settings.TESTING else None,
+        execution_options={"isolation_level": "AUTOCOMMIT"},
+        connect_args={
+            "server_settings": {"jit": "off"},
+            "command_timeout": 10,
+        },
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+
+ReadOnlySessionLocal = async_sessionmaker(
+    readonly_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def init_db() -> None:
     """Initialize database tables."""
@@ -63,4 +112,10 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
                 # Commit happens automatically when context exits successfully
             except Exception:
                 # Rollback happens automatically on exception
-                raise
\ No newline at end of file
+                raise
+
+
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only session; no explicit transaction is opened."""
+    async with ReadOnlySessionLocal() as session:
+        yield session
\ No newline at end of file
@@ -12,17 +12,29 @@ from enum import Enum
 from typing import Optional, Dict, Any, List, Annotated, Union
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, JSON, DateTime, Float, Integer, Index
+from sqlalchemy import Column, String, JSON, DateTime, Float, Integer, Index, Uuid, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.types import TypeDecorator, CHAR
-from pydantic import BaseModel, Field, ConfigDict, computed_field
+from pydantic import BaseModel, Field, ConfigDict, computed_field, field_validator
 from annotated_doc import Doc
 
 Base = declarative_base()
 
+# JSON columns are stored as JSONB on PostgreSQL (binary, pre-parsed,
+# indexable) and plain JSON elsewhere (SQLite).
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class GUID(TypeDecorator):
-    """Platform-agnostic GUID type for SQLite and PostgreSQL compatibility."""
+    """Platform-agnostic GUID type for SQLite and PostgreSQL compatibility.
+
+    Retained only for migration 001, which renders the original CHAR(36)
+    schema through it. The live model uses sqlalchemy.Uuid (native
+    16-byte uuid on PostgreSQL, hex CHAR(32) elsewhere), whose
+    conversions run in the driver instead of per-row Python.
+    """
     impl = CHAR
     cache_ok = True
 
@@ -31,17 +43,39 @@ class GUID(TypeDecorator):
 
     def process_bind_param(self, value, dialect):
         if value is None:
-            return value
-        elif isinstance(value, UUID):
+            return None
+        if type(value) is UUID:
             return str(value)
-        else:
-            return str(UUID(value))
+        return str(UUID(value))
 
     def process_result_value(self, value, dialect):
-        if value is None:
+        return value if value is None else UUID(value)
+
+    def literal_processor(self, dialect):
+        def process(value):
+            return f"'{value}'"
+        return process
+
+
+class CoercingUuid(TypeDecorator):
+    """sqlalchemy.Uuid that accepts string binds.
+
+    The worker passes job ids around as strings (Celery task args are
+    JSON), and the stdlib Uuid bind processor assumes UUID instances on
+    non-native backends (``value.hex``). Coercing here keeps the native
+    16-byte storage on PostgreSQL while string binds keep working on
+    SQLite, as they did with the old GUID type.
+    """
+    impl = Uuid
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(as_uuid=True, native_uuid=True)
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, UUID):
             return value
-        else:
-            return UUID(value)
+        return UUID(value)
 
 
 class JobStatus(str, Enum):
@@ -60,23 +94,41 @@ class JobPriority(str, Enum):
     HIGH = "high"
 
 
+# status/priority are native ENUM types on PostgreSQL (4-byte OID storage
+# and integer comparison instead of variable-length text) and plain
+# strings elsewhere (SQLite has no enum type).
+StatusVariant = String().with_variant(
+    SAEnum(JobStatus, name="job_status", native_enum=True,
+           values_callable=lambda e: [m.value for m in e]),
+    "postgresql",
+)
+PriorityVariant = String().with_variant(
+    SAEnum(JobPriority, name="job_priority", native_enum=True,
+           values_callable=lambda e: [m.value for m in e]),
+    "postgresql",
+)
+
+
 class Job(Base):
     """Database model for processing jobs."""
     __tablename__ = "jobs"
 
-    id = Column(GUID(), primary_key=True, default=uuid4)
-    status = Column(String, default=JobStatus.QUEUED, nullable=False, index=True)
-    priority = Column(String, default=JobPriority.NORMAL, nullable=False)
+    id = Column(CoercingUuid(), primary_key=True, default=uuid4)
+    status = Column(StatusVariant, default=JobStatus.QUEUED, nullable=False, index=True)
+    priority = Column(PriorityVariant, default=JobPriority.NORMAL, nullable=False)
 
     # Input/Output
     input_path = Column(String, nullable=False)
     output_path = Column(String, nullable=False)
-    input_metadata = Column(JSON, default={})
-    output_metadata = Column(JSON, default={})
+    # Empty-container defaults are server-side (migration 015): the
+    # database fills them in, so an INSERT that leaves them unset skips
+    # the Python-side JSON encode of a fresh {} / [] per row.
+    input_metadata = Column(JSONVariant, server_default=text("'{}'"))
+    output_metadata = Column(JSONVariant, server_default=text("'{}'"))
 
     # Processing options
-    options = Column(JSON, default={})
-    operations = Column(JSON, default=[])
+    options = Column(JSONVariant, server_default=text("'{}'"))
+    operations = Column(JSONVariant, server_default=text("'[]'"))
 
     # Progress tracking
     progress = Column(Float, default=0.0)
@@ -86,7 +138,7 @@ class Job(Base):
     fps = Column(Float, nullable=True)
     eta_seconds = Column(Integer, nullable=True)
     updated_at = Column(DateTime, nullable=True)
-    processing_stats = Column(JSON, nullable=True)
+    processing_stats = Column(JSONVariant, nullable=True)
 
     # Quality metrics
     vmaf_score = Column(Float, nullable=True)
@@ -100,7 +152,7 @@ class Job(Base):
 
     # Error handling
     error_message = Column(String, nullable=True)
-    error_details = Column(JSON, nullable=True)
+    error_details = Column(JSONVariant, nullable=True)
     retry_count = Column(Integer, default=0)
 
     # Resource tracking
@@ -112,7 +164,7 @@ class Job(Base):
 
     # Webhook
     webhook_url = Column(String, nullable=True)
-    webhook_events = Column(JSON, default=["complete", "error"])
+    webhook_events = Column(JSONVariant, server_default=text("'[\"complete\", \"error\"]'"))
 
     # Batch processing
     batch_id = Column(String, nullable=True, index=True)
@@ -122,6 +174,32 @@ class Job(Base):
     __table_args__ = (
         Index("idx_job_status_created", "status", "created_at"),
         Index("idx_job_api_key_created", "api_key", "created_at"),
+        # Covering index: INCLUDE carries every column the listing
+        # endpoint returns, so the paginated query is an index-only scan
+        # on PostgreSQL (the INCLUDE list is ignored on SQLite).
+        Index(
+            "idx_job_api_key_created_cov",
+            "api_key",
+            "created_at",
+            postgresql_include=[
+                "id", "status", "priority", "progress", "stage",
+                "started_at", "completed_at", "eta_seconds",
+            ],
+        ),
+        # Pre-sorted batch listing (mirrors migration 008)
+        Index("ix_jobs_batch_id_index", "batch_id", "batch_index"),
+        # Batch status/cancel filter on (batch_id, api_key); the INCLUDE
+        # list carries the columns those queries read so they run as
+        # index-only scans on PostgreSQL (mirrors migration 018).
+        Index(
+            "ix_jobs_batch_api_cover",
+            "batch_id",
+            "api_key",
+            postgresql_include=[
+                "id", "status", "progress", "batch_index", "worker_id",
+                "created_at", "started_at", "completed_at",
+            ],
+        ),
     )
 
 
@@ -222,11 +300,42 @@ class ConvertRequest(BaseModel):
         Doc("List of events: start, progress, complete, error")
     ]
 
+    @field_validator("input", "output", mode="before")
+    @classmethod
+    def _fast_union(cls, v):
+        """Reject non-str/dict payloads before union resolution.
+
+        pydantic-core's smart union picks the matching branch by type
+        for valid input, but an invalid payload is still tried against
+        every member's coercions; the exact type check fails those fast
+        with a single clear message.
+        """
+        if type(v) is str or type(v) is dict:
+            return v
+        raise ValueError("must be a string path or a configuration object")
+
+
+# Terminal statuses as plain strings for fast membership tests in the
+# response fast path (DB rows carry status as str, not JobStatus).
+_TERMINAL_STATUSES = frozenset((
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value,
+))
+
+# Statuses that count as in-flight; shared by the routers so hot paths
+# do not rebuild a list (and re-resolve the enum members) per request.
+ACTIVE_STATUSES = frozenset((JobStatus.QUEUED, JobStatus.PROCESSING))
+
 
 class JobResponse(BaseModel):
     """Response schema for job information with computed properties."""
+    # frozen models skip validate_assignment machinery and intern their
+    # field set at class-creation time; responses are built in one shot
+    # so immutability costs nothing here.
     model_config = ConfigDict(
         from_attributes=True,
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -323,7 +432,9 @@ class JobResponse(BaseModel):
     @property
     def is_complete(self) -> bool:
         """Whether the job has finished (success or failure)."""
-        return self.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
+        # Module-level frozenset: no list allocation per access, and a
+        # hashed lookup instead of three equality compares.
+        return self.status in _TERMINAL_STATUSES
 
     @computed_field
     @property
@@ -333,10 +444,53 @@ class JobResponse(BaseModel):
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
+    @staticmethod
+    def from_row_fast(job) -> Dict[str, Any]:
+        """Build the response dict straight from a Job row.
+
+        Bypasses Pydantic instantiation and validation for hot list
+        endpoints; the resulting dict matches model_dump() output
+        (computed fields included) and serializes directly with orjson,
+        which handles UUID and datetime natively.
+        """
+        status = job.status
+        data = {
+            "id": job.id,
+            "status": status,
+            "priority": job.priority,
+            "progress": job.progress,
+            "stage": job.stage,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "eta_seconds": job.eta_seconds,
+            "links": {
+                "self": f"/api/v1/jobs/{job.id}",
+                "events": f"/api/v1/jobs/{job.id}/events",
+                "logs": f"/api/v1/jobs/{job.id}/logs",
+            },
+            "error": None,
+            "progress_details": None,
+            "is_complete": status in _TERMINAL_STATUSES,
+            "duration_seconds": (
+                (job.completed_at - job.started_at).total_seconds()
+                if job.started_at and job.completed_at else None
+            ),
+        }
+
+        if status == JobStatus.FAILED:
+            data["error"] = {
+                "message": job.error_message,
+                "details": job.error_details,
+            }
+
+        return data
+
 
 class JobProgress(BaseModel):
     """Real-time progress update schema for SSE/WebSocket."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -403,6 +557,7 @@ class JobProgress(BaseModel):
 class JobListResponse(BaseModel):
     """Paginated response for job listing with metadata."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -457,12 +612,14 @@ class JobListResponse(BaseModel):
     @property
     def total_pages(self) -> int:
         """Total number of pages."""
-        return max(1, (self.total + self.per_page - 1) // self.per_page)
+        # Ceiling division without the intermediate addition.
+        return max(1, -(-self.total // self.per_page))
 
 
 class JobCreateResponse(BaseModel):
     """Response after successfully creating a job."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -506,6 +663,7 @@ class JobCreateResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Standardized error response format."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
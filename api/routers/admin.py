@@ -4,35 +4,104 @@ Admin endpoints - System management with FastAPI 0.124+ patterns.
 Provides worker management, storage status, statistics, and cleanup operations.
 Requires admin API key for access.
 """
+import asyncio
+import time
 from typing import Dict, Any, List, Annotated
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, and_
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, and_, delete, literal
 from annotated_doc import Doc
 import structlog
 
 from api.config import settings
-from api.dependencies import DatabaseSession, require_api_key
+from api.dependencies import DatabaseSession, ReadOnlySession, require_api_key
 from api.models.job import Job, JobStatus, ErrorResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 logger = structlog.get_logger()
-router = APIRouter()
+# Admin handlers return ORJSONResponse directly, which already bypasses
+# FastAPI's response-model revalidation pass; the router default covers
+# any future handler that returns a plain dict. response_model stays in
+# the decorators purely for OpenAPI.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+def _utcnow() -> datetime:
+    """Naive UTC now via the non-deprecated aware API.
+
+    The DB columns hold naive UTC timestamps, so the tzinfo is stripped
+    after the aware clock read.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Stats period units; a month is approximated as 30 days.
+_PERIOD_UNITS = {
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "m": timedelta(days=30),
+}
+
+# Ops dashboards poll the admin read endpoints every few seconds while
+# their values change on the same timescale, so responses are memoized
+# in-process for a short TTL: N pollers cost one DB aggregation /
+# backend probe per window instead of one per request. The same TTL is
+# advertised via Cache-Control (private: these responses are
+# per-admin-key authenticated) so well-behaved clients back off too.
+_READ_CACHE_TTL = 5.0  # seconds
+_READ_CACHE_MAX_SIZE = 64
+_read_cache: Dict[str, tuple] = {}  # key -> (expires_at_monotonic, payload)
+_READ_CACHE_HEADERS = {"Cache-Control": f"private, max-age={int(_READ_CACHE_TTL)}"}
+
+
+def _cached_payload(key: str):
+    """Return the cached payload for key, or None if absent/expired."""
+    entry = _read_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_payload(key: str, payload) -> None:
+    """Cache payload for key; the cache is dropped wholesale if it grows."""
+    if len(_read_cache) >= _READ_CACHE_MAX_SIZE:
+        _read_cache.clear()
+    _read_cache[key] = (time.monotonic() + _READ_CACHE_TTL, payload)
+
+
+# Lazy import to avoid circular dependency. The resolved service is
+# memoized after startup so steady-state requests skip the module lookup;
+# None (service not started yet) is deliberately never cached.
+_queue_service = None
+_storage_service = None
 
-# Lazy import to avoid circular dependency
 def get_queue_service():
-    from api.main import queue_service
-    return queue_service
+    global _queue_service
+    if _queue_service is None:
+        from api.main import queue_service
+        _queue_service = queue_service
+    return _queue_service
 
 def get_storage_service():
-    from api.main import storage_service
-    return storage_service
+    global _storage_service
+    if _storage_service is None:
+        from api.main import storage_service
+        _storage_service = storage_service
+    return _storage_service
 
 
-# Response models for OpenAPI documentation
+# Response models for OpenAPI documentation. They are no longer
+# instantiated per request (handlers return ORJSONResponse dicts), but
+# frozen + extra="forbid" keeps them cheap and strict anywhere they are
+# constructed, matching the job response schemas.
 class WorkerInfo(BaseModel):
     """Worker status information."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: Annotated[str, Doc("Worker identifier")]
     status: Annotated[str, Doc("Current status: active, idle, offline")]
     hostname: Annotated[str, Doc("Worker hostname")]
@@ -43,6 +112,8 @@ class WorkerInfo(BaseModel):
 
 class WorkersStatusResponse(BaseModel):
     """Workers status response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_workers: Annotated[int, Doc("Total number of workers")]
     workers: Annotated[List[Dict[str, Any]], Doc("List of worker details")]
     summary: Annotated[Dict[str, int], Doc("Worker count by status")]
@@ -50,6 +121,8 @@ class WorkersStatusResponse(BaseModel):
 
 class StorageStatusResponse(BaseModel):
     """Storage backends status response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     backends: Annotated[Dict[str, Dict[str, Any]], Doc("Status of each storage backend")]
     default_backend: Annotated[str | None, Doc("Default storage backend name")]
     policies: Annotated[Dict[str, Any], Doc("Storage routing policies")]
@@ -57,6 +130,8 @@ class StorageStatusResponse(BaseModel):
 
 class SystemStatsResponse(BaseModel):
     """System statistics response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     period: Annotated[str, Doc("Statistics period")]
     start_time: Annotated[str, Doc("Period start timestamp")]
     jobs: Annotated[Dict[str, Any], Doc("Job statistics")]
@@ -66,6 +141,8 @@ class SystemStatsResponse(BaseModel):
 
 class CleanupResponse(BaseModel):
     """Cleanup operation response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     dry_run: Annotated[bool, Doc("Whether this was a dry run")]
     jobs_deleted: Annotated[int | None, Doc("Number of jobs deleted")] = None
     jobs_to_delete: Annotated[int | None, Doc("Jobs that would be deleted (dry run)")] = None
@@ -75,27 +152,48 @@ class CleanupResponse(BaseModel):
 
 class PresetResponse(BaseModel):
     """Encoding preset response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: Annotated[str, Doc("Preset name")]
     description: Annotated[str | None, Doc("Preset description")] = None
     settings: Annotated[Dict[str, Any], Doc("Encoding settings")]
 
 
+class PresetCreateRequest(BaseModel):
+    """Encoding preset creation request.
+
+    Required fields are enforced by Pydantic's compiled validators, so
+    the handler never re-checks presence by hand.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    name: Annotated[str, Doc("Preset name")]
+    description: Annotated[str | None, Doc("Preset description")] = None
+    settings: Annotated[Dict[str, Any], Doc("Encoding settings")]
+
+
+# Admin keys parsed once at import: membership is a hash lookup instead
+# of a split + list scan per request. Empty entries are dropped so a
+# trailing comma cannot admit the empty string.
+_ADMIN_KEYS = frozenset(
+    key.strip() for key in settings.ADMIN_API_KEYS.split(',') if key.strip()
+)
+
+
 async def require_admin(api_key: str = Depends(require_api_key)) -> str:
     """
     Dependency to require admin privileges.
 
     Validates the API key against configured admin keys.
     """
-    admin_keys = settings.ADMIN_API_KEYS.split(',') if hasattr(settings, 'ADMIN_API_KEYS') and settings.ADMIN_API_KEYS else []
-
-    if not admin_keys:
+    if not _ADMIN_KEYS:
         logger.warning("No admin API keys configured - admin endpoints disabled")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"error": "not_configured", "message": "Admin functionality not configured"}
         )
 
-    if api_key not in admin_keys:
+    if api_key not in _ADMIN_KEYS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={"error": "access_denied", "message": "Admin access required"}
@@ -120,7 +218,7 @@ async def require_admin(api_key: str = Depends(require_api_key)) -> str:
 )
 async def get_workers_status(
     admin: Annotated[str, Depends(require_admin), Doc("Admin API key")],
-) -> WorkersStatusResponse:
+) -> ORJSONResponse:
     """
     Get status of all workers in the system.
 
@@ -128,17 +226,29 @@ async def get_workers_status(
     Only accessible with admin API key.
     """
     try:
-        workers = await get_queue_service().get_workers_status()
-
-        return WorkersStatusResponse(
-            total_workers=len(workers),
-            workers=workers,
-            summary={
-                "active": sum(1 for w in workers if w.get("status") == "active"),
-                "idle": sum(1 for w in workers if w.get("status") == "idle"),
-                "offline": sum(1 for w in workers if w.get("status") == "offline"),
-            },
-        )
+        payload = _cached_payload("workers")
+        if payload is None:
+            workers = await get_queue_service().get_workers_status()
+
+            # One Counter pass over the list instead of a generator sweep
+            # per status bucket.
+            counts = Counter(w.get("status") for w in workers)
+
+            payload = {
+                "total_workers": len(workers),
+                "workers": workers,
+                "summary": {
+                    "active": counts["active"],
+                    "idle": counts["idle"],
+                    "offline": counts["offline"],
+                },
+            }
+            _store_payload("workers", payload)
+
+        # Return the dict directly and serialize with orjson; skips the
+        # jsonable_encoder walk and response-model re-validation. The
+        # decorator's response_model still documents the schema.
+        return ORJSONResponse(payload, headers=_READ_CACHE_HEADERS)
     except Exception as e:
         logger.error("Failed to get workers status", error=str(e))
         raise HTTPException(
@@ -164,35 +274,49 @@ async def get_workers_status(
 )
 async def get_storage_status(
     admin: Annotated[str, Depends(require_admin), Doc("Admin API key")],
-) -> StorageStatusResponse:
+) -> ORJSONResponse:
     """
     Get status of all storage backends.
 
     Returns health status, available space, and configuration for each backend.
     """
     try:
-        storage_status = {}
+        payload = _cached_payload("storage")
+        if payload is not None:
+            return ORJSONResponse(payload, headers=_READ_CACHE_HEADERS)
+
+        storage_service = get_storage_service()
+
+        # Probe every backend concurrently; wall time is the slowest
+        # backend instead of the sum, and a failing probe only marks its
+        # own backend unhealthy.
+        items = list(storage_service.backends.items())
+        results = await asyncio.gather(
+            *(backend.get_status() for _, backend in items),
+            return_exceptions=True,
+        )
 
-        for name, backend in get_storage_service().backends.items():
-            try:
-                # Get backend-specific status
-                backend_status = await backend.get_status()
+        storage_status = {}
+        for (name, backend), outcome in zip(items, results):
+            if isinstance(outcome, BaseException):
                 storage_status[name] = {
-                    "status": "healthy",
-                    "type": backend.__class__.__name__,
-                    **backend_status,
+                    "status": "unhealthy",
+                    "error": str(outcome),
                 }
-            except Exception as e:
+            else:
                 storage_status[name] = {
-                    "status": "unhealthy",
-                    "error": str(e),
+                    "status": "healthy",
+                    "type": backend.__class__.__name__,
+                    **outcome,
                 }
 
-        return StorageStatusResponse(
-            backends=storage_status,
-            default_backend=get_storage_service().config.get("default_backend"),
-            policies=get_storage_service().config.get("policies", {}),
-        )
+        payload = {
+            "backends": storage_status,
+            "default_backend": storage_service.config.get("default_backend"),
+            "policies": storage_service.config.get("policies", {}),
+        }
+        _store_payload("storage", payload)
+        return ORJSONResponse(payload, headers=_READ_CACHE_HEADERS)
     except Exception as e:
         logger.error("Failed to get storage status", error=str(e))
         raise HTTPException(
@@ -222,34 +346,32 @@ async def get_system_stats(
         Query(pattern=r"^(\d+[hdwm])$", description="Time period (e.g., 24h, 7d, 4w, 1m)"),
         Doc("Statistics aggregation period")
     ] = "24h",
-    db: DatabaseSession = None,
+    db: ReadOnlySession = None,
     admin: Annotated[str, Depends(require_admin), Doc("Admin API key")] = None,
-) -> SystemStatsResponse:
+) -> ORJSONResponse:
     """
     Get system statistics for the specified period.
 
     Returns aggregated metrics for jobs, queue depth, and worker performance.
     Period format: number + unit (h=hours, d=days, w=weeks, m=months).
     """
-    # Parse period
-    unit = period[-1]
-    value = int(period[:-1])
-
-    if unit == "h":
-        delta = timedelta(hours=value)
-    elif unit == "d":
-        delta = timedelta(days=value)
-    elif unit == "w":
-        delta = timedelta(weeks=value)
-    elif unit == "m":
-        delta = timedelta(days=value * 30)
-
-    start_time = datetime.utcnow() - delta
-
-    # Get job statistics
-    stats_query = (
+    payload = _cached_payload(f"stats:{period}")
+    if payload is not None:
+        return ORJSONResponse(payload, headers=_READ_CACHE_HEADERS)
+
+    # Parse period: one dict lookup and a multiply, no branch ladder.
+    # The format is already enforced by the Query pattern.
+    start_time = _utcnow() - _PERIOD_UNITS[period[-1]] * int(period[:-1])
+
+    # Get job statistics. Per-status counts and the overall aggregates
+    # travel in one statement (grouped rows UNION ALL a NULL-status
+    # totals row), so the database does all the summing and averaging
+    # and the API receives a constant-size result in a single
+    # round-trip. avg() skips NULLs, so avg_vmaf only averages scored
+    # jobs.
+    grouped = (
         select(
-            Job.status,
+            Job.status.label("status"),
             func.count(Job.id).label("count"),
             func.avg(Job.processing_time).label("avg_time"),
             func.avg(Job.vmaf_score).label("avg_vmaf"),
@@ -257,25 +379,54 @@ async def get_system_stats(
         .where(Job.created_at >= start_time)
         .group_by(Job.status)
     )
+    totals = select(
+        literal(None).label("status"),
+        func.count(Job.id).label("count"),
+        func.avg(Job.processing_time).label("avg_time"),
+        func.avg(Job.vmaf_score).label("avg_vmaf"),
+    ).where(Job.created_at >= start_time)
+
+    # The DB aggregation and the two queue-service probes are
+    # independent, so they run concurrently: wall time is the slowest
+    # of the three instead of their sum.
+    queue_service = get_queue_service()
+    result, queue_stats, worker_stats = await asyncio.gather(
+        db.execute(grouped.union_all(totals)),
+        queue_service.get_queue_stats(),
+        queue_service.get_workers_stats(),
+    )
 
-    result = await db.execute(stats_query)
-    job_stats = result.all()
+    by_status = {}
+    total = 0
+    avg_time = None
+    avg_vmaf = None
+    for row in result:
+        if row.status is None:
+            total, avg_time, avg_vmaf = row.count, row.avg_time, row.avg_vmaf
+        else:
+            # On PostgreSQL the native-enum column hydrates JobStatus
+            # members, and orjson refuses non-str dict keys (even str
+            # subclasses); SQLite yields plain strings. Key on the value
+            # either way.
+            status = row.status
+            key = status.value if isinstance(status, JobStatus) else status
+            by_status[key] = row.count
 
     # Format statistics
-    stats = SystemStatsResponse(
-        period=period,
-        start_time=start_time.isoformat(),
-        jobs={
-            "total": sum(row.count for row in job_stats),
-            "by_status": {row.status: row.count for row in job_stats},
-            "avg_processing_time": sum(row.avg_time or 0 for row in job_stats) / len(job_stats) if job_stats else 0,
-            "avg_vmaf_score": sum(row.avg_vmaf or 0 for row in job_stats if row.avg_vmaf) / sum(1 for row in job_stats if row.avg_vmaf) if any(row.avg_vmaf for row in job_stats) else None,
+    payload = {
+        "period": period,
+        "start_time": start_time.isoformat(),
+        "jobs": {
+            "total": total,
+            "by_status": by_status,
+            "avg_processing_time": avg_time or 0,
+            "avg_vmaf_score": avg_vmaf,
         },
-        queue=await get_queue_service().get_queue_stats(),
-        workers=await get_queue_service().get_workers_stats(),
-    )
-
-    return stats
+        "queue": queue_stats,
+        "workers": worker_stats,
+    }
+    _store_payload(f"stats:{period}", payload)
+    return ORJSONResponse(payload, headers=_READ_CACHE_HEADERS)
 
 
 @router.post(
@@ -306,66 +457,88 @@ async def cleanup_old_jobs(
     ] = True,
     db: DatabaseSession = None,
     admin: Annotated[str, Depends(require_admin), Doc("Admin API key")] = None,
-) -> CleanupResponse:
+) -> ORJSONResponse:
     """
     Clean up old completed jobs and their associated files.
 
     By default runs in dry-run mode to preview deletions.
     Only removes jobs in terminal states (completed, failed, cancelled).
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    cutoff_date = _utcnow() - timedelta(days=days)
+    cutoff_iso = cutoff_date.isoformat()
 
-    # Find old jobs
-    query = select(Job).where(
-        and_(
-            Job.completed_at < cutoff_date,
-            Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED])
-        )
+    old_filter = and_(
+        Job.completed_at < cutoff_date,
+        Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]),
     )
 
-    result = await db.execute(query)
-    old_jobs = result.scalars().all()
-
     if dry_run:
-        return CleanupResponse(
-            dry_run=True,
-            jobs_to_delete=len(old_jobs),
-            cutoff_date=cutoff_date.isoformat(),
-        )
+        # A count is all the preview needs; no row fetch.
+        count = await db.scalar(select(func.count(Job.id)).where(old_filter))
+        return ORJSONResponse({
+            "dry_run": True,
+            "jobs_to_delete": count,
+            "cutoff_date": cutoff_iso,
+        })
+
+    # Delete output files concurrently in bounded batches: the awaits
+    # are latency-dominated, so overlapping them converts 10k sequential
+    # round-trips into ~10k/32 batches.
+    sem = asyncio.Semaphore(32)
+    storage_service = get_storage_service()
+
+    async def _delete_file(output_path: str) -> None:
+        async with sem:
+            backend_name, file_path = storage_service.parse_uri(output_path)
+            backend = storage_service.backends.get(backend_name)
+            if backend:
+                await backend.delete(file_path)
+
+    # Stream id/output_path rows from a server-side cursor and work in
+    # 1000-row partitions: the working set stays one batch regardless of
+    # how many historical jobs match, and no ORM objects are built for
+    # rows that are about to be deleted anyway.
+    stream = await db.stream(
+        select(Job.id, Job.output_path)
+        .where(old_filter)
+        .execution_options(yield_per=1000)
+    )
 
-    # Delete files and jobs
-    deleted_count = 0
     errors = []
-
-    for job in old_jobs:
-        try:
-            # Delete output file if it exists
-            if job.output_path:
-                backend_name, file_path = get_storage_service().parse_uri(job.output_path)
-                backend = get_storage_service().backends.get(backend_name)
-                if backend:
-                    await backend.delete(file_path)
-
-            # Delete job record
-            await db.delete(job)
-            deleted_count += 1
-
-        except Exception as e:
-            errors.append({
-                "job_id": str(job.id),
-                "error": str(e),
-            })
+    deletable_ids = []
+    async for batch in stream.partitions(1000):
+        with_files = [job for job in batch if job.output_path]
+        results = await asyncio.gather(
+            *(_delete_file(job.output_path) for job in with_files),
+            return_exceptions=True,
+        )
+        failed_ids = set()
+        for job, outcome in zip(with_files, results):
+            if isinstance(outcome, BaseException):
+                failed_ids.add(job.id)
+                errors.append({
+                    "job_id": str(job.id),
+                    "error": str(outcome),
+                })
+        deletable_ids.extend(job.id for job in batch if job.id not in failed_ids)
+
+    # Bulk DELETEs go after the streaming cursor closes (the session
+    # holds one connection), chunked to keep the IN list bounded.
+    deleted_count = len(deletable_ids)
+    for start in range(0, deleted_count, 1000):
+        chunk = deletable_ids[start:start + 1000]
+        await db.execute(delete(Job).where(Job.id.in_(chunk)))
 
     await db.commit()
 
     logger.info(f"Cleanup completed: {deleted_count} jobs deleted")
 
-    return CleanupResponse(
-        dry_run=False,
-        jobs_deleted=deleted_count,
-        errors=errors if errors else None,
-        cutoff_date=cutoff_date.isoformat(),
-    )
+    return ORJSONResponse({
+        "dry_run": False,
+        "jobs_deleted": deleted_count,
+        "errors": errors if errors else None,
+        "cutoff_date": cutoff_iso,
+    })
 
 
 @router.post(
@@ -392,34 +565,25 @@ async def cleanup_old_jobs(
     tags=["admin"],
 )
 async def create_preset(
-    preset: Annotated[Dict[str, Any], Doc("Preset configuration with name and settings")],
+    preset: Annotated[PresetCreateRequest, Doc("Preset configuration with name and settings")],
     admin: Annotated[str, Depends(require_admin), Doc("Admin API key")],
-) -> PresetResponse:
+) -> ORJSONResponse:
     """
     Create a new encoding preset.
 
     Presets define reusable encoding configurations for common use cases.
+    Missing name/settings are rejected with a 422 by request validation.
     """
-    # Validate preset
-    if "name" not in preset:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"error": "validation_error", "message": "Preset name required"}
-        )
-
-    if "settings" not in preset:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"error": "validation_error", "message": "Preset settings required"}
-        )
-
     # Save preset (in production, save to database)
-    logger.info(f"Preset created: {preset['name']}")
+    logger.info(f"Preset created: {preset.name}")
 
-    return PresetResponse(
-        name=preset["name"],
-        description=preset.get("description"),
-        settings=preset["settings"],
+    return ORJSONResponse(
+        {
+            "name": preset.name,
+            "description": preset.description,
+            "settings": preset.settings,
+        },
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -435,58 +599,69 @@ async def create_preset(
     },
     tags=["admin"],
 )
-async def list_presets() -> List[PresetResponse]:
+async def list_presets() -> Response:
     """
     List available encoding presets.
 
     Returns both built-in presets and any custom presets created by admins.
     This endpoint does not require admin authentication.
     """
-    return [
-        PresetResponse(
-            name="web-1080p",
-            description="Standard 1080p for web streaming",
-            settings={
-                "video": {
-                    "codec": "h264",
-                    "preset": "medium",
-                    "crf": 23,
-                    "resolution": "1920x1080",
-                },
-                "audio": {
-                    "codec": "aac",
-                    "bitrate": "128k",
-                },
+    # Static unauthenticated payload; let clients and shared caches keep
+    # it for an hour.
+    return Response(
+        content=_PRESETS_PAYLOAD,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+
+# Built-in presets are static, so the response body is serialized once at
+# import (same pattern as the root endpoint payload in api.main).
+_PRESETS_PAYLOAD = orjson.dumps([
+    {
+        "name": "web-1080p",
+        "description": "Standard 1080p for web streaming",
+        "settings": {
+            "video": {
+                "codec": "h264",
+                "preset": "medium",
+                "crf": 23,
+                "resolution": "1920x1080",
             },
-        ),
-        PresetResponse(
-            name="web-720p",
-            description="Standard 720p for web streaming",
-            settings={
-                "video": {
-                    "codec": "h264",
-                    "preset": "medium",
-                    "crf": 23,
-                    "resolution": "1280x720",
-                },
-                "audio": {
-                    "codec": "aac",
-                    "bitrate": "128k",
-                },
+            "audio": {
+                "codec": "aac",
+                "bitrate": "128k",
             },
-        ),
-        PresetResponse(
-            name="archive-high",
-            description="High quality for archival",
-            settings={
-                "video": {
-                    "codec": "h265",
-                    "preset": "slow",
-                    "crf": 18,
-                },
-                "audio": {
-                    "codec": "flac",
-                },
+        },
+    },
+    {
+        "name": "web-720p",
+        "description": "Standard 720p for web streaming",
+        "settings": {
+            "video": {
+                "codec": "h264",
+                "preset": "medium",
+                "crf": 23,
+                "resolution": "1280x720",
+            },
+            "audio": {
+                "codec": "aac",
+                "bitrate": "128k",
             },
-        ),
-    ]
+        },
+    },
+    {
+        "name": "archive-high",
+        "description": "High quality for archival",
+        "settings": {
+            "video": {
+                "codec": "h265",
+                "preset": "slow",
+                "crf": 18,
+            },
+            "audio": {
+                "codec": "flac",
+            },
+        },
+    },
+])
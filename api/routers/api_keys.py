@@ -10,7 +10,12 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from api.dependencies import get_db, require_api_key, get_current_user
+from api.dependencies import (
+    get_db,
+    require_api_key,
+    get_current_user,
+    invalidate_api_key_cache,
+)
 from api.services.api_key import APIKeyService
 
 router = APIRouter(prefix="/api-keys", tags=["API Keys"])
@@ -279,7 +284,10 @@ async def update_api_key(
         
         # Update the key
         updated_key = await APIKeyService.update_api_key(db, key_id, updates)
-        
+
+        # Drop cached validations so the changes take effect immediately
+        invalidate_api_key_cache()
+
         logger.info(
             "API key updated",
             key_id=str(key_id),
@@ -323,7 +331,10 @@ async def revoke_api_key(
         revoked_key = await APIKeyService.revoke_api_key(
             db, key_id, revoked_by=current_user.get("id")
         )
-        
+
+        # Drop cached validations so the revocation takes effect immediately
+        invalidate_api_key_cache()
+
         logger.info(
             "API key revoked",
             key_id=str(key_id),
@@ -3,22 +3,30 @@ Batch processing endpoint - Multiple media file processing with FastAPI 0.124+ p
 
 Provides efficient batch job creation, status monitoring, and cancellation.
 """
+import asyncio
+from datetime import datetime
 from typing import Dict, Any, List, Annotated, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert, select, update
 from annotated_doc import Doc
 import structlog
 
 from api.config import settings
 from api.dependencies import DatabaseSession, RequiredAPIKey
-from api.models.job import Job, JobStatus, JobResponse, ErrorResponse
+from api.models.job import Job, JobStatus, JobResponse, ErrorResponse, ACTIVE_STATUSES
 from api.utils.validators import validate_input_path, validate_output_path, validate_operations
 from api.utils.media_validator import media_validator
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 logger = structlog.get_logger()
-router = APIRouter()
+# orjson serializes the batch payloads (100 JobResponses with nested
+# link dicts, UUIDs, datetimes) in C instead of stdlib json.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Lazy import to avoid circular dependency
 def get_queue_service():
@@ -98,6 +106,35 @@ class BatchProcessRequest(BaseModel):
     }
 
 
+def _trunc(value: str, limit: int = 50) -> str:
+    """Truncate a string for log display."""
+    return value if len(value) <= limit else value[:limit] + "..."
+
+
+async def _batch_size_guard(request: Request) -> None:
+    """Reject oversize batch bodies before any validation work.
+
+    A declared Content-Length over the limit is 413'd without reading
+    the body, so junk payloads never reach pydantic.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > settings.MAX_BATCH_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail={
+                "error": "payload_too_large",
+                "message": f"Batch request body exceeds {settings.MAX_BATCH_BYTES} bytes",
+            },
+        )
+
+
+# Module-level adapter for the batch request body. validate_json goes
+# from raw bytes straight to models in pydantic-core, skipping the
+# intermediate dict tree FastAPI's default body handling would build for
+# up to 100 nested BatchJobs.
+_BATCH_REQUEST_ADAPTER = TypeAdapter(BatchProcessRequest)
+
+
 class BatchProcessResponse(BaseModel):
     """Batch processing response model."""
     batch_id: Annotated[str, Doc("Unique batch identifier")]
@@ -147,9 +184,23 @@ class BatchCancelResponse(BaseModel):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
     tags=["batch"],
+    dependencies=[Depends(_batch_size_guard)],
+    # The body is validated by _BATCH_REQUEST_ADAPTER in the handler;
+    # openapi_extra keeps the schema in the docs (same split as
+    # response_model + ORJSONResponse on the read endpoints).
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": BatchProcessRequest.model_json_schema(),
+                },
+            },
+        },
+    },
 )
 async def create_batch_job(
-    request: Annotated[BatchProcessRequest, Doc("Batch processing request")],
+    http_request: Request,
     background_tasks: BackgroundTasks,
     db: DatabaseSession = None,
     api_key: RequiredAPIKey = None,
@@ -166,19 +217,17 @@ async def create_batch_job(
     - Webhook notifications for batch events
     - Cost estimation for the entire batch
     """
+    # Validate the raw body in one pydantic-core pass; errors are
+    # re-raised as RequestValidationError so clients still get the
+    # standard 422 shape.
     try:
-        if not request.jobs:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "validation_error", "message": "No jobs provided in batch"}
-            )
-
-        if len(request.jobs) > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "validation_error", "message": "Batch size exceeds maximum of 100 jobs"}
-            )
+        request = _BATCH_REQUEST_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
 
+    try:
+        # Batch size bounds (1-100 jobs) are enforced by the
+        # BatchProcessRequest field constraints during validation.
         batch_id = str(uuid4())
         created_jobs = []
         warnings = []
@@ -188,7 +237,7 @@ async def create_batch_job(
             "Starting batch job creation",
             batch_id=batch_id,
             total_jobs=len(request.jobs),
-            api_key=api_key[:8] + "..." if len(api_key) > 8 else api_key
+            api_key=_trunc(api_key, 8)
         )
 
         # Validate all files first if requested
@@ -198,104 +247,161 @@ async def create_batch_job(
             # Get API key tier for validation limits
             api_key_tier = _get_api_key_tier(api_key)
 
-            validation_results = await media_validator.validate_batch_files(
+            # Stream the per-file results and count only the invalid
+            # ones; no full result array is materialized.
+            invalid_count = 0
+            async for _file_path, error in media_validator.iter_validate_files(
                 file_paths, api_key_tier
-            )
+            ):
+                if error is not None:
+                    invalid_count += 1
 
-            if validation_results['invalid_files'] > 0:
-                invalid_files = [
-                    r for r in validation_results['results']
-                    if r['status'] == 'invalid'
-                ]
-                warnings.append(f"Found {len(invalid_files)} invalid files in batch")
+            if invalid_count > 0:
+                warnings.append(f"Found {invalid_count} invalid files in batch")
 
                 # Fail the entire batch if all files are invalid
-                if len(invalid_files) == len(request.jobs):
+                if invalid_count == len(request.jobs):
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail={"error": "validation_error", "message": "All files in batch failed validation"}
                     )
 
-        # Create individual jobs
-        for i, job_request in enumerate(request.jobs):
-            try:
-                # Validate paths
-                input_backend, input_validated = await validate_input_path(
-                    job_request.input, storage_service
-                )
-                output_backend, output_validated = await validate_output_path(
-                    job_request.output, storage_service
+        # Validate every job first and collect the row values; the
+        # insert itself is a single executemany below instead of an
+        # add/commit/refresh round-trip per job.
+        storage_service = get_storage_service()
+        created_at = datetime.utcnow()
+
+        # Path validation may probe storage backends, so run the
+        # input/output checks of each job in parallel and the jobs
+        # themselves concurrently under a semaphore: batch validation
+        # latency approaches the slowest probe instead of the sum.
+        validation_sem = asyncio.Semaphore(16)
+
+        # Batches are typically homogeneous — every job carries the same
+        # operation list — so operation validation is memoized by its
+        # canonical JSON form: the common 100-job batch validates
+        # operations once instead of 100 times. Paths still validate
+        # per job (they differ per file).
+        ops_cache: Dict[bytes, List[Dict[str, Any]]] = {}
+
+        def _validated_ops(operations):
+            key = orjson.dumps(operations, option=orjson.OPT_SORT_KEYS)
+            cached = ops_cache.get(key)
+            if cached is None:
+                cached = validate_operations(operations)
+                ops_cache[key] = cached
+            return cached
+
+        async def _validate_job(job_request: BatchJob):
+            async with validation_sem:
+                (_, input_validated), (_, output_validated) = await asyncio.gather(
+                    validate_input_path(job_request.input, storage_service),
+                    validate_output_path(job_request.output, storage_service),
                 )
+            operations_validated = _validated_ops(job_request.operations)
+            return input_validated, output_validated, operations_validated
 
-                # Validate operations
-                operations_validated = validate_operations(job_request.operations)
+        validations = await asyncio.gather(
+            *(_validate_job(job_request) for job_request in request.jobs),
+            return_exceptions=True,
+        )
 
-                # Create job record
-                job = Job(
-                    id=uuid4(),
-                    status=JobStatus.QUEUED,
-                    priority=job_request.priority,
-                    input_path=input_validated,
-                    output_path=output_validated,
-                    options=job_request.options,
-                    operations=operations_validated,
-                    api_key=api_key,
-                    webhook_url=request.webhook_url,
-                    webhook_events=request.webhook_events,
+        rows = []
+        row_priorities = []
+        for i, (job_request, outcome) in enumerate(zip(request.jobs, validations)):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Failed to create batch job",
                     batch_id=batch_id,
                     batch_index=i,
+                    error=str(outcome)
                 )
+                warnings.append(f"Job {i + 1} failed to create: {str(outcome)}")
+            else:
+                input_validated, output_validated, operations_validated = outcome
+
+                rows.append({
+                    "id": uuid4(),
+                    "status": JobStatus.QUEUED,
+                    "priority": job_request.priority,
+                    "input_path": input_validated,
+                    "output_path": output_validated,
+                    "options": job_request.options,
+                    "operations": operations_validated,
+                    "api_key": api_key,
+                    "webhook_url": request.webhook_url,
+                    "webhook_events": request.webhook_events,
+                    "batch_id": batch_id,
+                    "batch_index": i,
+                    "created_at": created_at,
+                })
+                row_priorities.append(job_request.priority)
+                total_estimated_time += _estimate_job_time(job_request)
+
+        if rows:
+            # One INSERT for the whole batch, one commit, one fsync;
+            # created_at is assigned client-side so no refresh/RETURNING
+            # round-trip is needed.
+            await db.execute(insert(Job), rows)
+            await db.commit()
+
+            # Stringify each job id exactly once; the same string feeds
+            # the enqueue call, the links, and the error logs instead of
+            # re-converting the UUID at every use.
+            job_id_strs = [str(row["id"]) for row in rows]
+
+            # Enqueue the whole batch concurrently: one gather instead
+            # of a sequential broker round-trip per job. A failed
+            # enqueue becomes a warning; the job row stays QUEUED and
+            # can be re-driven.
+            queue_service = get_queue_service()
+            enqueue_results = await asyncio.gather(
+                *(
+                    queue_service.enqueue_job(job_id=jid, priority=priority)
+                    for jid, priority in zip(job_id_strs, row_priorities)
+                ),
+                return_exceptions=True,
+            )
 
-                # Add to database
-                db.add(job)
-                await db.commit()
-                await db.refresh(job)
-
-                # Queue the job
-                await get_queue_service().enqueue_job(
-                    job_id=str(job.id),
-                    priority=job_request.priority,
-                )
+            batch_link = f"/api/v1/batch/{batch_id}"
+            for row, jid, priority, outcome in zip(
+                rows, job_id_strs, row_priorities, enqueue_results
+            ):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        "Failed to enqueue batch job",
+                        job_id=jid,
+                        batch_id=batch_id,
+                        error=str(outcome),
+                    )
+                    warnings.append(
+                        f"Job {row['batch_index'] + 1} created but not enqueued: {outcome}"
+                    )
 
-                # Create job response
-                job_response = JobResponse(
-                    id=job.id,
-                    status=job.status,
-                    priority=job.priority,
+                # model_construct skips validation: every value here is
+                # trusted internal data from the rows we just inserted.
+                created_jobs.append(JobResponse.model_construct(
+                    id=row["id"],
+                    status=JobStatus.QUEUED,
+                    priority=priority,
                     progress=0.0,
                     stage="queued",
-                    created_at=job.created_at,
+                    created_at=created_at,
                     links={
-                        "self": f"/api/v1/jobs/{job.id}",
-                        "events": f"/api/v1/jobs/{job.id}/events",
-                        "logs": f"/api/v1/jobs/{job.id}/logs",
-                        "cancel": f"/api/v1/jobs/{job.id}",
-                        "batch": f"/api/v1/batch/{batch_id}"
+                        "self": f"/api/v1/jobs/{jid}",
+                        "events": f"/api/v1/jobs/{jid}/events",
+                        "logs": f"/api/v1/jobs/{jid}/logs",
+                        "cancel": f"/api/v1/jobs/{jid}",
+                        "batch": batch_link
                     },
-                )
+                ))
 
-                created_jobs.append(job_response)
-
-                # Estimate processing time
-                estimated_time = _estimate_job_time(job_request)
-                total_estimated_time += estimated_time
-
-                logger.info(
-                    "Batch job created",
-                    job_id=str(job.id),
-                    batch_id=batch_id,
-                    batch_index=i,
-                    input_path=job_request.input[:50] + "..." if len(job_request.input) > 50 else job_request.input
-                )
-
-            except Exception as e:
-                logger.error(
-                    "Failed to create batch job",
-                    batch_id=batch_id,
-                    batch_index=i,
-                    error=str(e)
-                )
-                warnings.append(f"Job {i + 1} failed to create: {str(e)}")
+            logger.info(
+                "Batch jobs inserted",
+                batch_id=batch_id,
+                jobs_created=len(rows),
+            )
 
         if not created_jobs:
             raise HTTPException(
@@ -371,29 +477,54 @@ async def get_batch_status(
     Only the API key that created the batch can view its status.
     """
     try:
-        # Query all jobs in the batch
-        from sqlalchemy import select
-        result = await db.execute(
-            select(Job).where(Job.batch_id == batch_id, Job.api_key == api_key)
+        # Aggregate in SQL: one grouped scan over the batch_id index
+        # returns per-status counts and the progress sum, instead of
+        # hydrating every Job row and sweeping the list per status.
+        agg = await db.execute(
+            select(
+                Job.status,
+                func.count(Job.id),
+                func.coalesce(func.sum(Job.progress), 0.0),
+            )
+            .where(Job.batch_id == batch_id, Job.api_key == api_key)
+            .group_by(Job.status)
         )
-        batch_jobs = result.scalars().all()
 
-        if not batch_jobs:
+        counts = {}
+        total_progress = 0.0
+        for job_status, count, progress_sum in agg:
+            counts[job_status] = count
+            total_progress += progress_sum
+
+        total_jobs = sum(counts.values())
+        if not total_jobs:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"error": "not_found", "message": "Batch not found"}
             )
 
-        # Calculate batch statistics
-        total_jobs = len(batch_jobs)
-        completed_jobs = sum(1 for job in batch_jobs if job.status == JobStatus.COMPLETED)
-        failed_jobs = sum(1 for job in batch_jobs if job.status == JobStatus.FAILED)
-        processing_jobs = sum(1 for job in batch_jobs if job.status == JobStatus.PROCESSING)
-        queued_jobs = sum(1 for job in batch_jobs if job.status == JobStatus.QUEUED)
+        completed_jobs = counts.get(JobStatus.COMPLETED.value, 0)
+        failed_jobs = counts.get(JobStatus.FAILED.value, 0)
+        processing_jobs = counts.get(JobStatus.PROCESSING.value, 0)
+        queued_jobs = counts.get(JobStatus.QUEUED.value, 0)
+        overall_progress = total_progress / total_jobs
 
-        # Calculate overall progress
-        total_progress = sum(job.progress or 0 for job in batch_jobs)
-        overall_progress = total_progress / total_jobs if total_jobs > 0 else 0
+        # Per-job summary: select only the rendered columns, ordered in
+        # SQL, so no ORM objects are built and no Python sort runs.
+        result = await db.execute(
+            select(
+                Job.id,
+                Job.status,
+                Job.progress,
+                Job.created_at,
+                Job.started_at,
+                Job.completed_at,
+                Job.input_path,
+                Job.output_path,
+            )
+            .where(Job.batch_id == batch_id, Job.api_key == api_key)
+            .order_by(Job.batch_index)
+        )
 
         # Determine batch status
         if completed_jobs == total_jobs:
@@ -429,7 +560,7 @@ async def get_batch_status(
                     "input_path": job.input_path,
                     "output_path": job.output_path
                 }
-                for job in sorted(batch_jobs, key=lambda x: x.batch_index or 0)
+                for job in result
             ]
         )
 
@@ -470,59 +601,73 @@ async def cancel_batch(
     Already completed or failed jobs are not affected.
     """
     try:
-        # Query all jobs in the batch
-        from sqlalchemy import select, update
-        result = await db.execute(
-            select(Job).where(Job.batch_id == batch_id, Job.api_key == api_key)
+        total_jobs = await db.scalar(
+            select(func.count(Job.id))
+            .where(Job.batch_id == batch_id, Job.api_key == api_key)
         )
-        batch_jobs = result.scalars().all()
-
-        if not batch_jobs:
+        if not total_jobs:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"error": "not_found", "message": "Batch not found"}
             )
 
+        # Fetch the cancellable rows (old status and worker_id drive the
+        # queue-level cancel), then flip them all with one UPDATE
+        # instead of a statement per job.
+        result = await db.execute(
+            select(Job.id, Job.status, Job.worker_id)
+            .where(
+                Job.batch_id == batch_id,
+                Job.api_key == api_key,
+                Job.status.in_(ACTIVE_STATUSES),
+            )
+        )
+        active_jobs = result.all()
+
         cancelled_count = 0
         failed_to_cancel = 0
 
-        for job in batch_jobs:
-            if job.status in [JobStatus.QUEUED, JobStatus.PROCESSING]:
-                try:
-                    # Cancel job in queue
-                    if job.status == JobStatus.QUEUED:
-                        success = await get_queue_service().cancel_job(str(job.id))
-                    else:  # PROCESSING
-                        success = await get_queue_service().cancel_running_job(
-                            str(job.id),
-                            job.worker_id or ""
-                        )
-
-                    if success:
-                        # Update job status
-                        await db.execute(
-                            update(Job)
-                            .where(Job.id == job.id)
-                            .values(status=JobStatus.CANCELLED)
-                        )
-                        cancelled_count += 1
-                    else:
-                        failed_to_cancel += 1
-
-                except Exception as e:
+        if active_jobs:
+            await db.execute(
+                update(Job)
+                .where(Job.id.in_([job.id for job in active_jobs]))
+                .values(status=JobStatus.CANCELLED)
+            )
+            await db.commit()
+
+            # Queue-level cancels are independent RPCs; issue them
+            # concurrently. The rows are already CANCELLED, so a failed
+            # RPC only means the worker may finish redundant work.
+            queue_service = get_queue_service()
+            outcomes = await asyncio.gather(
+                *(
+                    queue_service.cancel_job(str(job.id))
+                    if job.status == JobStatus.QUEUED
+                    else queue_service.cancel_running_job(
+                        str(job.id), job.worker_id or ""
+                    )
+                    for job in active_jobs
+                ),
+                return_exceptions=True,
+            )
+
+            for job, outcome in zip(active_jobs, outcomes):
+                if isinstance(outcome, BaseException):
                     logger.error(
                         "Failed to cancel job in batch",
                         job_id=str(job.id),
                         batch_id=batch_id,
-                        error=str(e)
+                        error=str(outcome),
                     )
                     failed_to_cancel += 1
-
-        await db.commit()
+                elif outcome:
+                    cancelled_count += 1
+                else:
+                    failed_to_cancel += 1
 
         return BatchCancelResponse(
             batch_id=batch_id,
-            total_jobs=len(batch_jobs),
+            total_jobs=total_jobs,
             cancelled=cancelled_count,
             failed_to_cancel=failed_to_cancel,
             message=f"Cancelled {cancelled_count} jobs in batch"
@@ -538,32 +683,35 @@ async def cancel_batch(
         )
 
 
+# Tier by key prefix (the part before the first underscore); anything
+# unrecognized is the free tier.
+_TIER_BY_PREFIX = {
+    "ent": "enterprise",
+    "prem": "premium",
+    "basic": "basic",
+}
+
+
 def _get_api_key_tier(api_key: str) -> str:
     """Determine API key tier from key prefix."""
-    if api_key.startswith('ent_'):
-        return 'enterprise'
-    elif api_key.startswith('prem_'):
-        return 'premium'
-    elif api_key.startswith('basic_'):
-        return 'basic'
-    else:
-        return 'free'
+    # One split and one dict lookup instead of a startswith chain.
+    return _TIER_BY_PREFIX.get(api_key.split("_", 1)[0], "free")
+
+
+# Per-operation time estimates in seconds; anything unknown costs the
+# default 30s.
+_OP_TIME = {
+    "streaming": 300,
+    "transcode": 120,
+    "watermark": 60,
+    "filter": 60,
+}
 
 
 def _estimate_job_time(job_request: BatchJob) -> int:
     """Estimate processing time for a single job in seconds."""
-    base_time = 60  # Base processing time
-
-    # Add time based on operations
-    for operation in job_request.operations:
-        op_type = operation.get('type', '')
-        if op_type == 'streaming':
-            base_time += 300  # Streaming takes longer
-        elif op_type == 'transcode':
-            base_time += 120  # Transcoding time
-        elif op_type in ['watermark', 'filter']:
-            base_time += 60   # Filter operations
-        else:
-            base_time += 30   # Other operations
-
-    return base_time
+    # 60s base plus a table lookup per operation — no branch ladder.
+    return 60 + sum(
+        _OP_TIME.get(operation.get("type"), 30)
+        for operation in job_request.operations
+    )
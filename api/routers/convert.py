@@ -6,22 +6,74 @@ Uses FastAPI 0.124+ features including:
 - Enhanced OpenAPI responses
 - Typed dependency injection
 """
+import ipaddress
+import socket
+from functools import lru_cache
 from typing import Dict, Any, Annotated
+from urllib.parse import urlparse
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, status
+from sqlalchemy import select, func
 from annotated_doc import Doc
 import structlog
 
 from api.config import settings
 from api.dependencies import DatabaseSession, RequiredAPIKey
-from api.models.job import Job, JobStatus, ConvertRequest, JobCreateResponse, JobResponse, ErrorResponse
+from api.models.api_key import APIKey as APIKeyModel
+from api.models.job import Job, JobStatus, ConvertRequest, JobCreateResponse, JobResponse, ErrorResponse, ACTIVE_STATUSES
 from api.utils.validators import validate_input_path, validate_output_path, validate_operations
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# SSRF blocklist for webhook URLs. Networks are pre-parsed at import to
+# (network_int, netmask_int) pairs split by IP version — membership is
+# one integer AND + compare per network (same representation the IP
+# whitelist in api.dependencies uses).
+_BLOCKED_HOSTNAMES = frozenset({'localhost', '127.0.0.1', '0.0.0.0', '::1'})
+
+
+def _net_ints(cidr: str) -> tuple:
+    network = ipaddress.ip_network(cidr)
+    return int(network.network_address), int(network.netmask)
+
+
+_V4_BLOCKED = tuple(_net_ints(cidr) for cidr in (
+    '10.0.0.0/8',        # Class A private
+    '172.16.0.0/12',     # Class B private (172.16-31.x.x)
+    '192.168.0.0/16',    # Class C private
+    '127.0.0.0/8',       # Loopback
+    '169.254.0.0/16',    # Link-local
+    '100.64.0.0/10',     # Carrier-grade NAT
+))
+_V6_BLOCKED = tuple(_net_ints(cidr) for cidr in (
+    '::1/128',           # IPv6 loopback
+    'fc00::/7',          # IPv6 unique local
+    'fe80::/10',         # IPv6 link-local
+))
+
+
+@lru_cache(maxsize=2048)
+def _classify_host(hostname: str):
+    """Parse a hostname as an IP via C-level inet_pton.
+
+    Returns (version, address_int) or None when the hostname is not an
+    IP literal. Much cheaper than ipaddress.ip_address, and the cache
+    makes repeat webhook hosts free.
+    """
+    try:
+        packed = socket.inet_pton(socket.AF_INET, hostname)
+        return 4, int.from_bytes(packed, 'big')
+    except OSError:
+        pass
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, hostname)
+        return 6, int.from_bytes(packed, 'big')
+    except OSError:
+        return None
+
 # Import services from main - they are initialized during app startup
 # Lazy import to avoid circular dependency
 def get_storage_service():
@@ -49,6 +101,7 @@ def get_queue_service():
 )
 async def convert_media(
     request: Annotated[ConvertRequest, Doc("Media conversion job specification")],
+    http_request: Request,
     background_tasks: BackgroundTasks,
     db: DatabaseSession,
     api_key: RequiredAPIKey,
@@ -69,36 +122,24 @@ async def convert_media(
         
         # Check webhook URL for SSRF if provided
         if request.webhook_url:
-            from urllib.parse import urlparse
-            import ipaddress
             parsed = urlparse(request.webhook_url)
 
             # Block internal/private networks using proper CIDR checking
             hostname = parsed.hostname
             if hostname:
                 # Block localhost variants
-                if hostname in ['localhost', '127.0.0.1', '0.0.0.0', '::1']:
+                if hostname in _BLOCKED_HOSTNAMES:
                     raise HTTPException(status_code=400, detail="Invalid webhook URL: localhost not allowed")
 
-                # Try to parse as IP address for CIDR checking
-                try:
-                    ip = ipaddress.ip_address(hostname)
-                    # Define private/reserved networks
-                    private_networks = [
-                        ipaddress.ip_network('10.0.0.0/8'),        # Class A private
-                        ipaddress.ip_network('172.16.0.0/12'),     # Class B private (172.16-31.x.x)
-                        ipaddress.ip_network('192.168.0.0/16'),    # Class C private
-                        ipaddress.ip_network('127.0.0.0/8'),       # Loopback
-                        ipaddress.ip_network('169.254.0.0/16'),    # Link-local
-                        ipaddress.ip_network('100.64.0.0/10'),     # Carrier-grade NAT
-                        ipaddress.ip_network('::1/128'),           # IPv6 loopback
-                        ipaddress.ip_network('fc00::/7'),          # IPv6 unique local
-                        ipaddress.ip_network('fe80::/10'),         # IPv6 link-local
-                    ]
-                    for network in private_networks:
-                        if ip in network:
-                            raise HTTPException(status_code=400, detail="Invalid webhook URL: private network not allowed")
-                except ValueError:
+                # IP literals get the integer CIDR check; anything else
+                # is a hostname.
+                classified = _classify_host(hostname)
+                if classified is not None:
+                    version, addr = classified
+                    networks = _V4_BLOCKED if version == 4 else _V6_BLOCKED
+                    if any((addr & mask) == net for net, mask in networks):
+                        raise HTTPException(status_code=400, detail="Invalid webhook URL: private network not allowed")
+                else:
                     # Not an IP address, hostname - could still resolve to private IP
                     # For safety, block common internal hostnames
                     lower_hostname = hostname.lower()
@@ -116,28 +157,54 @@ async def convert_media(
         # Validate operations
         operations_validated = validate_operations(request.operations)
         
-        # Check concurrent job limit for this API key
-        from sqlalchemy import select, func
-        from api.models.job import JobStatus
-        
-        # Count active jobs for this API key
-        active_jobs_stmt = select(func.count(Job.id)).where(
-            Job.api_key == api_key,
-            Job.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING])
-        )
-        result = await db.execute(active_jobs_stmt)
-        active_job_count = result.scalar() or 0
-        
-        # Get API key model to check limits
-        from api.services.api_key import APIKeyService
-        api_key_model = await APIKeyService.get_api_key_by_key(db, api_key)
-        max_concurrent = api_key_model.max_concurrent_jobs if api_key_model else 5  # Default limit
-        
-        if active_job_count >= max_concurrent:
-            raise HTTPException(
-                status_code=429, 
-                detail=f"Concurrent job limit exceeded ({active_job_count}/{max_concurrent})"
+        # Check concurrent job limit for this API key. The limit comes
+        # from one indexed column select; admission itself is an O(1)
+        # atomic Redis reservation instead of a COUNT over the jobs
+        # table on every submission. If Redis is unavailable the SQL
+        # count serves as the (self-healing) fallback.
+        queue_service = get_queue_service()
+
+        # require_api_key already validated the key and left the cached
+        # model on request.state; reading max_concurrent_jobs from there
+        # costs nothing. The column select only runs when the model is
+        # absent (API keys disabled).
+        # Explicit None checks: a configured limit of 0 means the key's
+        # submissions are suspended and must not fall back to the default.
+        api_key_model = getattr(http_request.state, "api_key_model", None)
+        if api_key_model is not None:
+            max_concurrent = api_key_model.max_concurrent_jobs
+        else:
+            max_concurrent = await db.scalar(
+                select(APIKeyModel.max_concurrent_jobs)
+                .where(APIKeyModel.key_hash == APIKeyModel.hash_key(api_key))
             )
+        if max_concurrent is None:
+            max_concurrent = 5  # Default limit
+
+        slot_reserved = False
+        try:
+            slot_reserved = await queue_service.reserve_slot(api_key, max_concurrent)
+            redis_available = True
+        except Exception as e:
+            logger.warning("Slot reservation unavailable, falling back to SQL count", error=str(e))
+            redis_available = False
+
+        if redis_available:
+            if not slot_reserved:
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Concurrent job limit exceeded (max {max_concurrent})"
+                )
+        else:
+            active_job_count = await db.scalar(
+                select(func.count(Job.id))
+                .where(Job.api_key == api_key, Job.status.in_(ACTIVE_STATUSES))
+            ) or 0
+            if active_job_count >= max_concurrent:
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Concurrent job limit exceeded ({active_job_count}/{max_concurrent})"
+                )
         
         # Create job record with database-managed UUID to prevent race conditions
         job = Job(
@@ -162,20 +229,27 @@ async def convert_media(
 
         # Queue the job (do this before commit in case queuing fails)
         try:
-            queue_service = get_queue_service()
             await queue_service.enqueue_job(
                 job_id=job_id_str,
                 priority=request.priority,
             )
         except Exception as e:
-            # If queuing fails, rollback the job creation
+            # If queuing fails, rollback the job creation and give the
+            # reserved slot back.
             await db.rollback()
+            if slot_reserved:
+                try:
+                    await queue_service.release_slot(api_key)
+                except Exception:
+                    pass  # TTL bounds the leak
             raise HTTPException(status_code=503, detail="Failed to queue job")
         
-        # Now commit the transaction
+        # Now commit the transaction. No refresh needed: the session
+        # keeps attributes live across commit (expire_on_commit=False)
+        # and every column the response reads — id, status, priority,
+        # created_at — was populated client-side before the flush.
         await db.commit()
-        await db.refresh(job)
-        
+
         # Log job creation
         logger.info(
             "Job created",
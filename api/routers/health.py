@@ -3,11 +3,14 @@ Health check endpoints with FastAPI 0.124+ patterns.
 
 Provides system health monitoring without authentication requirement.
 """
+import asyncio
+import os
+import time
 from datetime import datetime
-from typing import Dict, Any, Annotated
+from typing import Dict, Any, Annotated, Optional, Tuple
 
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from annotated_doc import Doc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -18,7 +21,17 @@ from api.dependencies import DatabaseSession
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# /health is the hottest endpoint in the service (kube liveness probes
+# at >=1Hz per replica) and its body only changes once a second. Cache
+# the rendered dict keyed on the integer epoch second so steady-state
+# hits allocate nothing beyond the response itself. No router- or
+# app-level dependency injects a DB session here; the handler stays
+# connection-free.
+_HEALTH_BASE = {"status": "healthy", "version": settings.VERSION}
+_health_ts = 0
+_health_body: Dict[str, Any] = {}
 
 # Lazy import to avoid circular dependency
 def get_queue_service():
@@ -30,6 +43,48 @@ def get_storage_service():
     return storage_service
 
 
+# Load balancers poll the health endpoints every few seconds; forking
+# ffmpeg/nvidia-smi on every hit is ~10ms of event-loop-blocking process
+# setup for answers that only change on deploy or reboot. Cache both
+# probes for a short TTL; the lock ensures a single probe runs per
+# expiry regardless of hit rate.
+_PROBE_CACHE_TTL = 60.0
+
+_ffmpeg_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_ffmpeg_lock = asyncio.Lock()
+
+_hwaccel_cache: Optional[Tuple[float, list]] = None
+_hwaccel_lock = asyncio.Lock()
+
+
+async def _get_ffmpeg_info() -> Dict[str, Any]:
+    """Probe `ffmpeg -version`, caching the result for a short TTL."""
+    global _ffmpeg_cache
+
+    if _ffmpeg_cache is not None and time.monotonic() < _ffmpeg_cache[0]:
+        return _ffmpeg_cache[1]
+
+    async with _ffmpeg_lock:
+        # Another waiter may have refreshed while we queued on the lock.
+        if _ffmpeg_cache is not None and time.monotonic() < _ffmpeg_cache[0]:
+            return _ffmpeg_cache[1]
+
+        proc = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-version',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+        if proc.returncode != 0:
+            raise Exception("FFmpeg not working")
+        info = {
+            "status": "healthy",
+            "version": stdout.decode().split("\n")[0],
+        }
+        _ffmpeg_cache = (time.monotonic() + _PROBE_CACHE_TTL, info)
+        return info
+
+
 # Response models for OpenAPI documentation
 class HealthResponse(Dict[str, Any]):
     """Health check response schema."""
@@ -78,11 +133,16 @@ async def health_check() -> Dict[str, Any]:
     Returns a simple health status without requiring authentication.
     Use `/health/detailed` for comprehensive component status.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": settings.VERSION,
-    }
+    global _health_ts, _health_body
+
+    now = int(time.time())
+    if now != _health_ts:
+        _health_body = {
+            **_HEALTH_BASE,
+            "timestamp": datetime.utcfromtimestamp(now).isoformat(),
+        }
+        _health_ts = now
+    return _health_body
 
 
 @router.get(
@@ -134,66 +194,43 @@ async def detailed_health_check(
         "components": {},
     }
 
-    # Check database
-    try:
-        result = await db.execute(text("SELECT 1"))
-        health_status["components"]["database"] = {
+    async def _check_database() -> Dict[str, Any]:
+        await db.execute(text("SELECT 1"))
+        return {
             "status": "healthy",
             "type": "postgresql" if "postgresql" in settings.DATABASE_URL else "sqlite",
         }
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["database"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
 
-    # Check queue
-    try:
-        queue_health = await get_queue_service().health_check()
-        health_status["components"]["queue"] = queue_health
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["queue"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+    async def _check_queue() -> Dict[str, Any]:
+        return await get_queue_service().health_check()
 
-    # Check storage backends
-    try:
-        storage_health = await get_storage_service().health_check()
-        health_status["components"]["storage"] = storage_health
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["storage"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+    async def _check_storage() -> Dict[str, Any]:
+        return await get_storage_service().health_check()
 
-    # Check FFmpeg
-    try:
-        import asyncio
-        proc = await asyncio.create_subprocess_exec(
-            'ffmpeg', '-version',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+    # Probe every component concurrently: total latency is the slowest
+    # probe (the ffmpeg check alone can take up to its 5s timeout)
+    # instead of the sum. A failing ffmpeg only degrades; the rest mark
+    # the service unhealthy.
+    checks = (
+        ("database", _check_database(), "unhealthy"),
+        ("queue", _check_queue(), "unhealthy"),
+        ("storage", _check_storage(), "unhealthy"),
+        ("ffmpeg", _get_ffmpeg_info(), "degraded"),
+    )
+    results = await asyncio.gather(
+        *(coro for _, coro, _ in checks), return_exceptions=True
+    )
 
-        if proc.returncode == 0:
-            version_line = stdout.decode().split("\n")[0]
-            health_status["components"]["ffmpeg"] = {
-                "status": "healthy",
-                "version": version_line,
+    for (name, _, failure_status), outcome in zip(checks, results):
+        if isinstance(outcome, BaseException):
+            if health_status["status"] != "unhealthy":
+                health_status["status"] = failure_status
+            health_status["components"][name] = {
+                "status": "unhealthy",
+                "error": str(outcome),
             }
         else:
-            raise Exception("FFmpeg not working")
-    except Exception as e:
-        health_status["status"] = "degraded"
-        health_status["components"]["ffmpeg"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+            health_status["components"][name] = outcome
 
     # Return appropriate status code
     if health_status["status"] == "unhealthy":
@@ -296,27 +333,37 @@ async def get_capabilities() -> Dict[str, Any]:
 
 
 async def check_hardware_acceleration() -> list:
-    """Check available hardware acceleration."""
-    available = []
+    """Check available hardware acceleration, cached for a short TTL."""
+    global _hwaccel_cache
 
-    # Check NVIDIA
-    try:
-        import asyncio
-        proc = await asyncio.create_subprocess_exec(
-            'nvidia-smi', '--query-gpu=name', '--format=csv,noheader',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+    if _hwaccel_cache is not None and time.monotonic() < _hwaccel_cache[0]:
+        return _hwaccel_cache[1]
+
+    async with _hwaccel_lock:
+        if _hwaccel_cache is not None and time.monotonic() < _hwaccel_cache[0]:
+            return _hwaccel_cache[1]
+
+        available = []
+
+        # Check NVIDIA
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'nvidia-smi', '--query-gpu=name', '--format=csv,noheader',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
 
-        if proc.returncode == 0:
-            available.append("nvidia")
-    except:
-        pass
+            if proc.returncode == 0:
+                available.append("nvidia")
+        except:
+            pass
 
-    # Check VAAPI (Linux)
-    import os
-    if os.path.exists("/dev/dri/renderD128"):
-        available.append("vaapi")
+        # Check VAAPI (Linux) — device presence is a boot-time property,
+        # but the render node can appear when a driver loads late, so it
+        # shares the TTL rather than being probed once forever.
+        if os.path.exists("/dev/dri/renderD128"):
+            available.append("vaapi")
 
-    return available
+        _hwaccel_cache = (time.monotonic() + _PROBE_CACHE_TTL, available)
+        return available
@@ -10,14 +10,14 @@ import json
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from annotated_doc import Doc
 from sqlalchemy import select, func
 import structlog
 
 from api.config import settings
 from api.dependencies import DatabaseSession, RequiredAPIKey
-from api.models.job import Job, JobStatus, JobResponse, JobListResponse, JobProgress, ErrorResponse
+from api.models.job import Job, JobStatus, JobResponse, JobListResponse, JobProgress, ErrorResponse, ACTIVE_STATUSES
 
 logger = structlog.get_logger()
 
@@ -68,7 +68,7 @@ async def list_jobs(
     ] = "created_at:desc",
     db: DatabaseSession = None,
     api_key: RequiredAPIKey = None,
-) -> JobListResponse:
+) -> ORJSONResponse:
     """
     List jobs with optional filtering and pagination.
 
@@ -78,8 +78,25 @@ async def list_jobs(
     # Parse sort parameter
     sort_field, sort_order = sort.split(":") if ":" in sort else (sort, "asc")
 
-    # Build query
-    query = select(Job).where(Job.api_key == api_key)
+    # Build query selecting only the columns the listing serializes.
+    # This returns plain Core rows instead of ORM instances — no
+    # identity-map bookkeeping or instance construction per row — and
+    # keeps the large JSON payload columns off the wire entirely.
+    # from_row_fast reads rows by attribute name, which Core rows
+    # support just like ORM objects.
+    query = select(
+        Job.id,
+        Job.status,
+        Job.priority,
+        Job.progress,
+        Job.stage,
+        Job.created_at,
+        Job.started_at,
+        Job.completed_at,
+        Job.eta_seconds,
+        Job.error_message,
+        Job.error_details,
+    ).where(Job.api_key == api_key)
 
     if status_filter:
         query = query.where(Job.status == status_filter)
@@ -101,44 +118,19 @@ async def list_jobs(
 
     # Execute query
     result = await db.execute(query)
-    jobs = result.scalars().all()
-
-    # Convert to response models
-    job_responses = []
-    for job in jobs:
-        job_response = JobResponse(
-            id=job.id,
-            status=job.status,
-            priority=job.priority,
-            progress=job.progress,
-            stage=job.stage,
-            created_at=job.created_at,
-            started_at=job.started_at,
-            completed_at=job.completed_at,
-            eta_seconds=job.eta_seconds,
-            links={
-                "self": f"/api/v1/jobs/{job.id}",
-                "events": f"/api/v1/jobs/{job.id}/events",
-                "logs": f"/api/v1/jobs/{job.id}/logs",
-            },
-        )
-
-        if job.status == JobStatus.FAILED:
-            job_response.error = {
-                "message": job.error_message,
-                "details": job.error_details,
-            }
+    jobs = result.all()
 
-        job_responses.append(job_response)
-
-    return JobListResponse(
-        jobs=job_responses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_next=total > page * per_page,
-        has_prev=page > 1,
-    )
+    # Build response dicts directly and serialize with orjson; skips
+    # Pydantic instantiation plus the output re-validation pass per row.
+    return ORJSONResponse({
+        "jobs": [JobResponse.from_row_fast(job) for job in jobs],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "has_next": total > page * per_page,
+        "has_prev": page > 1,
+        "total_pages": max(1, -(-total // per_page)),
+    })
 
 
 @router.get(
@@ -186,37 +178,20 @@ async def get_job(
             detail={"error": "access_denied", "message": "Access denied"}
         )
 
-    # Build response
-    response = JobResponse(
-        id=job.id,
-        status=job.status,
-        priority=job.priority,
-        progress=job.progress,
-        stage=job.stage,
-        created_at=job.created_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        eta_seconds=job.eta_seconds,
-        links={
-            "self": f"/api/v1/jobs/{job.id}",
-            "events": f"/api/v1/jobs/{job.id}/events",
-            "logs": f"/api/v1/jobs/{job.id}/logs",
-            "cancel": f"/api/v1/jobs/{job.id}" if job.status in [JobStatus.QUEUED, JobStatus.PROCESSING] else None,
-        },
-    )
-
-    # Add progress details
+    # Assemble the optional sections up front; JobResponse is frozen so
+    # everything must be passed to the constructor.
+    progress_details = None
     if job.status == JobStatus.PROCESSING:
-        response.progress_details = {
+        progress_details = {
             "percentage": job.progress,
             "stage": job.stage,
             "fps": job.fps,
             "eta_seconds": job.eta_seconds,
         }
 
-    # Add error details if failed
+    error = None
     if job.status == JobStatus.FAILED:
-        response.error = {
+        error = {
             "message": job.error_message,
             "details": job.error_details,
             "retry_count": job.retry_count,
@@ -224,16 +199,34 @@ async def get_job(
 
     # Add quality metrics if available
     if job.vmaf_score or job.psnr_score or job.ssim_score:
-        response.progress_details = response.progress_details or {}
-        response.progress_details["quality"] = {}
+        progress_details = progress_details or {}
+        progress_details["quality"] = {}
         if job.vmaf_score:
-            response.progress_details["quality"]["vmaf"] = job.vmaf_score
+            progress_details["quality"]["vmaf"] = job.vmaf_score
         if job.psnr_score:
-            response.progress_details["quality"]["psnr"] = job.psnr_score
+            progress_details["quality"]["psnr"] = job.psnr_score
         if job.ssim_score:
-            response.progress_details["quality"]["ssim"] = job.ssim_score
+            progress_details["quality"]["ssim"] = job.ssim_score
 
-    return response
+    return JobResponse(
+        id=job.id,
+        status=job.status,
+        priority=job.priority,
+        progress=job.progress,
+        stage=job.stage,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        eta_seconds=job.eta_seconds,
+        links={
+            "self": f"/api/v1/jobs/{job.id}",
+            "events": f"/api/v1/jobs/{job.id}/events",
+            "logs": f"/api/v1/jobs/{job.id}/logs",
+            "cancel": f"/api/v1/jobs/{job.id}" if job.status in ACTIVE_STATUSES else None,
+        },
+        progress_details=progress_details,
+        error=error,
+    )
 
 
 @router.delete(
@@ -279,7 +272,7 @@ async def cancel_job(
         )
 
     # Check if job can be cancelled
-    if job.status not in [JobStatus.QUEUED, JobStatus.PROCESSING]:
+    if job.status not in ACTIVE_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -289,7 +282,8 @@ async def cancel_job(
         )
 
     # Cancel in queue
-    if job.status == JobStatus.QUEUED:
+    was_queued = job.status == JobStatus.QUEUED
+    if was_queued:
         await get_queue_service().cancel_job(str(job_id))
     elif job.status == JobStatus.PROCESSING:
         # Send cancel signal to worker
@@ -300,6 +294,16 @@ async def cancel_job(
     job.completed_at = datetime.utcnow()
     await db.commit()
 
+    # A queued non-batch job reserved a concurrency slot at submission
+    # that no worker will ever release; give it back here. Processing
+    # jobs are left to the worker's finally block to avoid a double
+    # decrement. Batch jobs never reserve slots.
+    if was_queued and job.batch_id is None:
+        try:
+            await get_queue_service().release_slot(job.api_key)
+        except Exception:
+            pass  # TTL bounds the leak
+
     logger.info("Job cancelled", job_id=str(job_id))
 
     return {
@@ -1,18 +1,86 @@
 """
 API Key service for authentication and key management.
 """
+import hmac
+import json
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 import structlog
 
 from api.models.api_key import APIKey
 
 logger = structlog.get_logger()
 
+# Validated keys are cached in Redis for a short TTL so all workers share
+# one cache and revocations propagate within the TTL window. Only
+# non-sensitive snapshot fields are stored (<200 B per key).
+_VALIDATION_CACHE_TTL = 15  # seconds
+_CACHED_DATETIME_FIELDS = ("last_used_at", "expires_at", "revoked_at")
+_validation_redis = None
+
+
+def _get_validation_redis():
+    """Lazily create the shared Redis client for validation caching."""
+    global _validation_redis
+    if _validation_redis is None:
+        import redis.asyncio as redis
+
+        from api.config import settings
+
+        _validation_redis = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+        )
+    return _validation_redis
+
+
+def _validation_cache_key(key_prefix: str, key_hash: bytes) -> str:
+    return f"apik:{key_prefix}:{key_hash[:8].hex()}"
+
+
+def _snapshot_for_cache(api_key: APIKey) -> str:
+    """Serialize the fields the auth path needs into a compact JSON blob."""
+    return json.dumps({
+        "id": str(api_key.id),
+        "name": api_key.name,
+        "key_prefix": api_key.key_prefix,
+        "user_id": api_key.user_id,
+        "organization": api_key.organization,
+        "is_active": api_key.is_active,
+        "is_admin": api_key.is_admin,
+        "max_concurrent_jobs": api_key.max_concurrent_jobs,
+        "monthly_limit_minutes": api_key.monthly_limit_minutes,
+        "total_requests": api_key.total_requests,
+        "last_used_at": api_key.last_used_at.isoformat() if api_key.last_used_at else None,
+        "expires_at": api_key.expires_at.isoformat() if api_key.expires_at else None,
+        "revoked_at": api_key.revoked_at.isoformat() if api_key.revoked_at else None,
+    })
+
+
+def _api_key_from_snapshot(payload: str) -> APIKey:
+    """Rebuild a transient APIKey instance from a cached snapshot."""
+    data = json.loads(payload)
+    data["id"] = UUID(data["id"])
+    for field in _CACHED_DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return APIKey(**data)
+
+
+async def _invalidate_validation_cache(api_key: APIKey) -> None:
+    """Drop the cached snapshot after revoke/update so changes propagate."""
+    try:
+        await _get_validation_redis().delete(
+            _validation_cache_key(api_key.key_prefix, api_key.key_hash)
+        )
+    except Exception:
+        pass
+
 
 class APIKeyService:
     """Service for managing API keys."""
@@ -96,12 +164,60 @@ class APIKeyService:
         
         # Hash the key for lookup
         key_hash = APIKey.hash_key(raw_key)
-        
-        # Find API key by hash
-        stmt = select(APIKey).where(APIKey.key_hash == key_hash)
+
+        # Serve read-only validations from the shared Redis cache; the
+        # cache key embeds the hash so a hit already proves key equality.
+        cache_key = _validation_cache_key(raw_key[:8], key_hash)
+        if not update_usage:
+            try:
+                cached = await _get_validation_redis().get(cache_key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                api_key = _api_key_from_snapshot(cached)
+                return api_key if api_key.is_valid() else None
+
+        # Look up by the 8-char key_prefix rather than the 64-char hash:
+        # the prefix index key is an eighth of the size, so the B-tree
+        # touches fewer pages, and the prefix narrows to at most a couple
+        # of rows. The hash match is then decided in Python below. Only
+        # the columns present in the covering index (migration 013) are
+        # selected so PostgreSQL can answer the lookup with an index-only
+        # scan, skipping the heap fetch.
+        stmt = (
+            select(APIKey)
+            .options(
+                load_only(
+                    APIKey.id,
+                    APIKey.key_hash,
+                    APIKey.key_prefix,
+                    APIKey.is_active,
+                    APIKey.is_admin,
+                    APIKey.revoked_at,
+                    APIKey.expires_at,
+                    APIKey.user_id,
+                    APIKey.organization,
+                    APIKey.max_concurrent_jobs,
+                    APIKey.monthly_limit_minutes,
+                    APIKey.total_requests,
+                    APIKey.last_used_at,
+                    APIKey.name,
+                )
+            )
+            .where(APIKey.key_prefix == raw_key[:8])
+        )
         result = await session.execute(stmt)
-        api_key = result.scalar_one_or_none()
-        
+        candidates = result.scalars().all()
+
+        # Constant-time comparison of the stored hash against the computed
+        # hash defeats timing attacks without artificial delays. Every
+        # candidate is compared so the timing does not reveal which row
+        # (if any) matched.
+        api_key = None
+        for candidate in candidates:
+            if hmac.compare_digest(candidate.key_hash, key_hash):
+                api_key = candidate
+
         if not api_key:
             logger.warning("API key not found", key_prefix=raw_key[:8])
             return None
@@ -121,7 +237,15 @@ class APIKeyService:
         if update_usage:
             api_key.update_last_used()
             await session.commit()
-        
+
+        # Populate the shared cache; failures are non-fatal.
+        try:
+            await _get_validation_redis().setex(
+                cache_key, _VALIDATION_CACHE_TTL, _snapshot_for_cache(api_key)
+            )
+        except Exception:
+            pass
+
         logger.info(
             "API key validated successfully",
             key_id=str(api_key.id),
@@ -247,7 +371,8 @@ class APIKeyService:
         
         api_key.revoke()
         await session.commit()
-        
+        await _invalidate_validation_cache(api_key)
+
         logger.info(
             "API key revoked",
             key_id=str(api_key.id),
@@ -272,7 +397,8 @@ class APIKeyService:
         old_expiry = api_key.expires_at
         api_key.extend_expiry(additional_days)
         await session.commit()
-        
+        await _invalidate_validation_cache(api_key)
+
         logger.info(
             "API key expiry extended",
             key_id=str(api_key.id),
@@ -305,9 +431,10 @@ class APIKeyService:
         for field, value in updates.items():
             if field in allowed_fields and hasattr(api_key, field):
                 setattr(api_key, field, value)
-        
+
         await session.commit()
-        
+        await _invalidate_validation_cache(api_key)
+
         logger.info(
             "API key updated",
             key_id=str(api_key.id),
@@ -12,6 +12,23 @@ from api.config import settings
 
 logger = structlog.get_logger()
 
+# Atomic check-and-increment for the per-key active-job counter. The
+# 24h TTL bounds leak if a decrement is ever lost; the SQL fallback in
+# the convert endpoint self-heals on Redis outages.
+_RESERVE_SLOT_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], 86400)
+return 1
+"""
+
+
+def _slot_key(api_key: str) -> str:
+    return f"active_jobs:{api_key}"
+
 
 class QueueService:
     """Service for managing job queues."""
@@ -41,6 +58,25 @@ class QueueService:
         if self.redis_client:
             await self.redis_client.close()
     
+    async def reserve_slot(self, api_key: str, max_concurrent: int) -> bool:
+        """Atomically reserve an active-job slot for an API key.
+
+        One O(1) Redis op replaces a COUNT over the jobs table on every
+        submission. Returns False when the key is at its limit.
+        """
+        result = await self.redis_client.eval(
+            _RESERVE_SLOT_LUA, 1, _slot_key(api_key), max_concurrent
+        )
+        return bool(result)
+
+    async def release_slot(self, api_key: str) -> None:
+        """Release an active-job slot (enqueue failure or job finished)."""
+        remaining = await self.redis_client.decr(_slot_key(api_key))
+        if remaining < 0:
+            # Drifted below zero (e.g. counter expired mid-flight);
+            # clamp rather than let future reservations over-admit.
+            await self.redis_client.set(_slot_key(api_key), 0, ex=86400)
+
     async def enqueue_job(self, job_id: str, priority: str = "normal") -> str:
         """Add job to processing queue."""
         # Map priority to queue
@@ -151,14 +187,28 @@ class QueueService:
         return workers
     
     async def get_workers_stats(self) -> Dict[str, Any]:
-        """Get aggregated worker statistics."""
-        workers = await self.get_workers_status()
-        
+        """Get aggregated worker statistics.
+
+        Aggregates directly off the inspect payload in a single pass;
+        unlike get_workers_status it never builds per-worker task dicts,
+        so callers that only need the four counters pay O(workers)
+        instead of O(tasks).
+        """
+        active = self.celery_app.control.inspect().active()
+
+        total = active_count = total_tasks = 0
+        if active:
+            for tasks in active.values():
+                total += 1
+                if tasks:
+                    active_count += 1
+                    total_tasks += len(tasks)
+
         return {
-            "total": len(workers),
-            "active": sum(1 for w in workers if w["status"] == "active"),
-            "idle": sum(1 for w in workers if w["status"] == "idle"),
-            "total_tasks": sum(w["active_tasks"] for w in workers),
+            "total": total,
+            "active": active_count,
+            "idle": total - active_count,
+            "total_tasks": total_tasks,
         }
     
     async def get_worker_logs(self, worker_id: str, job_id: str, lines: int = 100) -> List[str]:
@@ -2,6 +2,7 @@
 Health check utilities for all system dependencies
 """
 import asyncio
+import time
 from typing import Dict, Any, Optional
 import structlog
 
@@ -16,12 +17,12 @@ class HealthChecker:
     async def check_database(self, db_session) -> Dict[str, Any]:
         """Check database connectivity and performance."""
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             # Simple connectivity test
             from sqlalchemy import text
             result = await db_session.execute(text("SELECT 1"))
-            response_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             
             return {
                 "status": "healthy",
@@ -41,12 +42,12 @@ class HealthChecker:
             import redis.asyncio as redis
             from api.config import settings
             
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             # Parse Redis URL
             redis_client = redis.from_url(settings.VALKEY_URL)
             await redis_client.ping()
-            response_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             
             # Check memory usage
             info = await redis_client.info('memory')
@@ -80,11 +81,11 @@ class HealthChecker:
             
             for name, backend in storage_service.backends.items():
                 try:
-                    start_time = asyncio.get_event_loop().time()
+                    start_time = time.perf_counter()
                     
                     # Try to list root directory
                     await backend.list("")
-                    response_time = (asyncio.get_event_loop().time() - start_time) * 1000
+                    response_time = (time.perf_counter() - start_time) * 1000
                     
                     backend_status[name] = {
                         "status": "healthy",
@@ -115,7 +116,7 @@ class HealthChecker:
     async def check_ffmpeg(self) -> Dict[str, Any]:
         """Check FFmpeg availability and version."""
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             proc = await asyncio.create_subprocess_exec(
                 'ffmpeg', '-version',
@@ -124,7 +125,7 @@ class HealthChecker:
             )
             
             stdout, stderr = await proc.communicate()
-            response_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             
             if proc.returncode == 0:
                 version_line = stdout.decode().split('\n')[0]
@@ -215,7 +216,7 @@ class HealthChecker:
             
             return {
                 "status": overall_status,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": time.time(),
                 "services": results
             }
             
@@ -224,7 +225,7 @@ class HealthChecker:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.time()
             }
     
     async def _dummy_db_check(self):
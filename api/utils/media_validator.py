@@ -330,7 +330,24 @@ class MediaValidator:
             logger.warning("Content security check failed", error=str(e))
             return security_info
     
-    async def validate_batch_files(self, file_paths: List[str], 
+    async def iter_validate_files(self, file_paths: List[str],
+                                  api_key_tier: str = 'free'):
+        """Validate files one at a time, yielding (file_path, error).
+
+        error is None for valid files. Callers consume the stream and
+        keep only what they need (typically the invalid entries), so
+        batch validation uses O(invalid) memory instead of
+        materializing a result dict per file.
+        """
+        for file_path in file_paths:
+            try:
+                await self.validate_media_file(file_path, api_key_tier)
+            except Exception as e:
+                yield file_path, str(e)
+            else:
+                yield file_path, None
+
+    async def validate_batch_files(self, file_paths: List[str],
                                  api_key_tier: str = 'free') -> Dict[str, any]:
         """Validate multiple files in batch."""
         results = {
@@ -340,7 +357,7 @@ class MediaValidator:
             'total_size': 0,
             'results': []
         }
-        
+
         for file_path in file_paths:
             try:
                 validation = await self.validate_media_file(file_path, api_key_tier)
@@ -358,7 +375,7 @@ class MediaValidator:
                     'status': 'invalid',
                     'error': str(e)
                 })
-        
+
         return results
 
 
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 # Import removed - using internal FFmpeg wrapper instead
+import redis
 import structlog
 import yaml
 from celery import Task, current_task
@@ -57,6 +58,31 @@ class ProcessingError(Exception):
     pass
 
 
+# Sync Redis client for the per-key active-job counter, created lazily
+# per worker process.
+_redis_client: Optional[redis.Redis] = None
+
+
+def _release_job_slot(api_key: Optional[str]) -> None:
+    """Decrement the per-key active-job counter (best effort).
+
+    The API reserves a slot per submitted job; releasing here keeps the
+    counter honest. The counter never goes negative (clamped) and
+    carries a TTL, so a missed release self-heals.
+    """
+    global _redis_client
+    if not api_key:
+        return
+    key = f"active_jobs:{api_key}"
+    try:
+        if _redis_client is None:
+            _redis_client = redis.from_url(settings.REDIS_URL)
+        if _redis_client.decr(key) < 0:
+            _redis_client.set(key, 0, ex=86400)
+    except Exception as e:
+        logger.warning("Failed to release job slot", api_key_prefix=api_key[:8], error=str(e))
+
+
 def update_job_status(job_id: str, updates: Dict[str, Any]) -> None:
     """Update job status in database."""
     db = SessionLocal()
@@ -114,9 +140,10 @@ def process_job(job_id: str) -> Dict[str, Any]:
     Main task for processing conversion jobs.
     """
     logger.info(f"Starting job processing: {job_id}")
-    
+
     # Get job from database
     db = SessionLocal()
+    job = None
     try:
         job = db.query(Job).filter(Job.id == job_id).first()
         if not job:
@@ -188,6 +215,10 @@ def process_job(job_id: str) -> Dict[str, Any]:
 
         raise
     finally:
+        # Batch jobs are admitted without a reservation; only release
+        # the slot for directly submitted jobs so the counter balances.
+        if job is not None and job.batch_id is None:
+            _release_job_slot(job.api_key)
         db.close()
 
 